@@ -20,11 +20,13 @@ flights under the `/flights` node.
 Instructions:
 
 1. Install dependencies (pandas, openpyxl, firebase_admin) using pip if
-   they are not already installed.
+   they are not already installed.  python-calamine is optional and
+   makes loading large Excel files considerably faster; numba is
+   optional and speeds up the statistics window on large histories.
 2. Place your Firebase service account JSON in the same directory as
    this script and update the `FIREBASE_CRED_FILE` and
    `FIREBASE_DB_URL` constants below.
-3. Run the script: `python coordination_app.py`
+3. Run the script with Python 3.10 or newer: `python coordination_app.py`
 4. Click "Load Excel" to select your pair report (.xlsx) file.
 5. Modify the "Slot" and "Flight Plan" columns as needed.
 6. Click "Publish to Firebase" to upload the current table to
@@ -36,14 +38,24 @@ existing roster logic.
 """
 
 import os
+import re
 import json
+import bisect
+import hashlib
+import threading
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
-from dataclasses import dataclass, asdict
+from tkinter import font as tkfont
+from dataclasses import dataclass, asdict, field, fields
+from functools import lru_cache
+from types import MappingProxyType
 from typing import List, Optional, Dict
 
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 try:
     import firebase_admin
@@ -52,12 +64,181 @@ except ImportError:
     # Firebase is optional; if unavailable, publishing will be disabled.
     firebase_admin = None
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; the standard json module is used otherwise.
+    orjson = None
+
+try:
+    import python_calamine
+except ImportError:
+    # calamine is optional; pandas falls back to its default Excel reader.
+    python_calamine = None
+
+try:
+    import numba
+except ImportError:
+    # numba is optional; statistics are aggregated with plain NumPy otherwise.
+    numba = None
+
 # ----- Configuration -----
 FIREBASE_CRED_FILE = 'serviceAccountKey.json'
 FIREBASE_DB_URL = 'https://turn-around-fa74b-default-rtdb.europe-west1.firebasedatabase.app'
 
+# Airline names/instructions are kept next to the script.
+SETTINGS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'airline_settings.json')
+
+DISPLAY_TIME_FORMAT = "%Y-%m-%d %H:%M"
+
+# Rows added to the flight table at a time; further pages are inserted as
+# the user scrolls towards the end.
+TREE_PAGE_SIZE = 500
+
+# Per-flight stats tables longer than this are drawn on a canvas that only
+# materialises the rows in view.
+CANVAS_TABLE_MIN_ROWS = 200
+
+# Quiet period before a queued airline settings save runs; further changes
+# within it are folded into the same save.
+SETTINGS_SAVE_DELAY_MS = 500
+
+# How often the Tk thread checks whether work handed to a worker thread
+# (Firebase loads and uploads, settings saves) has finished
+BACKGROUND_POLL_MS = 100
+
+# Per-flight table rows kept by StatsWindow for recently shown periods
+VIEW_ROW_CACHE_SIZE = 16
+
+# Shared read-only stand-in for a missing mapping
+_EMPTY = MappingProxyType({})
+
+# Alphabetic prefix of a flight number, e.g. "EZY" in "EZY1234".
+_AIRLINE_PREFIX = re.compile(r'^[^\W\d_]{1,3}')
+
+
+def _json_loads(data: bytes):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    # Keys are sorted so the same settings always serialise to the same bytes
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, indent=2, sort_keys=True).encode('utf-8')
+
+
+@lru_cache(maxsize=4096)
+def _airline_code(flight_number: str) -> str:
+    """Return the airline code (up to three leading letters, upper-cased)."""
+    m = _AIRLINE_PREFIX.match(flight_number)
+    return m.group(0).upper() if m else ""
 
-@dataclass
+
+@lru_cache(maxsize=256)
+def _norm(value: str) -> str:
+    """Normalise an airline code or aircraft type typed into the settings form."""
+    return value.strip().upper()
+
+
+def _airline_upload_entry(data: dict) -> dict:
+    """The part of an airline's settings that is uploaded to Firebase."""
+    return {
+        'name': data.get('name', ''),
+        'instructions': data.get('instructions', ''),
+        'layoutUrl': data.get('layoutUrl', ''),
+        'types': {
+            typ: {
+                'instructions': tdata.get('instructions', ''),
+                'layoutUrl': tdata.get('layoutUrl', '')
+            }
+            for typ, tdata in data['types'].items()
+        }
+    }
+
+
+def _to_timestamps(values: list) -> list:
+    """Convert ISO strings (or None) to Timestamps, NaT where missing or invalid."""
+    try:
+        return list(pd.to_datetime(values, errors="coerce", format="ISO8601"))
+    except ValueError:
+        # e.g. UTC offsets that differ across a DST change, which pandas
+        # will not put in one column; convert value by value instead.
+        return [pd.to_datetime(v, errors="coerce") if v else pd.NaT for v in values]
+
+
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp written by the turnaround app.
+
+    datetime.fromisoformat only accepts a trailing "Z" from Python 3.11, so
+    it is rewritten as a UTC offset first.  Anything fromisoformat rejects
+    still goes through pandas.
+    """
+    if isinstance(value, str):
+        if value.endswith('Z'):
+            value = value[:-1] + '+00:00'
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    return pd.to_datetime(value)
+
+
+@lru_cache(maxsize=1024)
+def _key_date(date_str: str) -> Optional[date]:
+    """Date part of a flight key ("YYYYMMDD"), or None if it is not a date."""
+    try:
+        if len(date_str) == 8 and date_str.isdigit():
+            return date(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:]))
+        return datetime.strptime(date_str, "%Y%m%d").date()
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=8192)
+def _parse_timestamp(iso: str) -> tuple:
+    """Return (datetime or None if unparseable, display text) for a timestamp.
+
+    Timestamps recur across flights and statistics windows, so both the
+    parse and the formatting are memoised.
+    """
+    if not iso:
+        return None, ''
+    try:
+        dt = _parse_iso(iso)
+        return dt, dt.strftime(DISPLAY_TIME_FORMAT)
+    except Exception:
+        return None, iso
+
+
+def _timestamp_date(iso: str) -> Optional[date]:
+    """Calendar date of a timestamp, read straight from an ISO YYYY-MM-DD prefix."""
+    try:
+        return date.fromisoformat(iso[:10])
+    except (TypeError, ValueError):
+        pass
+    dt = _parse_timestamp(iso)[0]
+    return dt.date() if dt is not None else None
+
+
+def _clear(frame: tk.Widget) -> None:
+    """Destroy all children of a frame, tearing the Tk windows down in one call."""
+    children = list(frame.children.values())
+    if not children:
+        return
+    frame.tk.call('destroy', *children)
+    # The Tk windows are gone already.  Calling child.destroy() would send
+    # another destroy per descendant, so release tkinter's side directly:
+    # drop the child maps and delete the callbacks each widget registered.
+    frame.children.clear()
+    while children:
+        widget = children.pop()
+        children.extend(widget.children.values())
+        widget.children.clear()
+        tk.Misc.destroy(widget)
+
+
+@dataclass(slots=True)
 class FlightRecord:
     flight: str
     sta: Optional[pd.Timestamp]
@@ -70,6 +251,13 @@ class FlightRecord:
     eta: str = ""
     parking: str = ""
     airline_code: str = ""
+    # Display strings for the table, formatted once (STA/STD are not editable)
+    sta_display: str = field(default="", init=False, repr=False, compare=False)
+    std_display: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.sta_display = self.sta.strftime(DISPLAY_TIME_FORMAT) if pd.notna(self.sta) else ""
+        self.std_display = self.std.strftime(DISPLAY_TIME_FORMAT) if pd.notna(self.std) else ""
 
     def to_firebase_dict(self) -> Dict[str, str]:
         sta_str = self.sta.isoformat() if pd.notna(self.sta) else ""
@@ -103,6 +291,52 @@ class CoordinationApp:
         self.all_flight_records: List[FlightRecord] = []
         self.flight_records: List[FlightRecord] = []
         self.airline_settings: Dict[str, Dict[str, str]] = {}
+        # airline code -> configured airline name, rebuilt with the settings
+        self._airline_name_map: Dict[str, str] = {}
+        # airline codes in sorted order, kept in step as codes are added/removed
+        self._sorted_airline_codes: List[str] = []
+        # Values currently shown in the tree, keyed by row iid
+        self._tree_row_state: Dict[str, tuple] = {}
+        # Number of flight_records currently materialised in the tree
+        self._tree_rows_shown = 0
+        self._tree_page_pending = False
+        # Bumped whenever the flight list is replaced locally, so a slower
+        # background Firebase load does not overwrite it.
+        self._records_generation = 0
+        # True while the table shows flights fetched from Firebase for the
+        # current period (re-queried when the filter leaves the fetched range).
+        self._records_from_firebase = True
+        # Bumped for every /flights fetch; only the latest one is shown.
+        self._flights_request = 0
+        # STA range held in all_flight_records when it came from Firebase
+        # (None once every flight has been fetched).
+        self._loaded_bounds: Optional[tuple] = None
+        # Firebase flights edited in the table, keyed by flight id, so a
+        # re-fetch for another period does not drop unpublished changes.
+        self._edited_records: Dict[str, FlightRecord] = {}
+        # Firebase app initialisation guard and cached database references
+        self._firebase_lock = threading.Lock()
+        self._flights_ref = None
+        self._ops_ref = None
+        self._airlines_ref = None
+        # Pending after() id of a queued airline settings save
+        self._settings_save_job = None
+        # Settings file writes and uploads run here, one at a time and in
+        # the order they were saved.
+        self._save_executor = ThreadPoolExecutor(max_workers=1)
+        # Digest of the last settings snapshot handed to the save worker
+        self._last_saved_hash = None
+        # Number of the last save handed to the worker, and of the last one
+        # that uploaded the full settings
+        self._save_seq = 0
+        self._full_upload_seq = 0
+        # Airlines ((code,)) and aircraft types ((code, type)) changed since
+        # the last upload.  Once the full settings have been uploaded, later
+        # saves only send these parts.
+        self._dirty_settings_keys = set()
+        self._settings_uploaded = False
+        # Set when the user ticks "don't ask again" on a delete confirmation
+        self.skip_delete_confirm = False
 
         # default filter: today's flights
         self.filter_type = 'Day'
@@ -112,30 +346,52 @@ class CoordinationApp:
         self.setup_firebase()
         self.load_airline_settings()
         self.load_existing_flights()
+        # Write out any queued settings save before the window goes away
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+    def on_close(self) -> None:
+        self.flush_airline_settings()
+        # Saves already queued still finish before the interpreter exits
+        self._save_executor.shutdown(wait=False)
+        self.root.destroy()
 
     # ---------------- UI ----------------
-    def create_widgets(self) -> None:
+    _styles_initialized = False
+
+    def _init_styles(self) -> None:
+        """
+        Configure the ttk styles used by the main window, the statistics
+        tables and the settings window.  Styles belong to the Tk
+        interpreter, so this only needs to run once.
+        """
+        if CoordinationApp._styles_initialized:
+            return
+        CoordinationApp._styles_initialized = True
         style = ttk.Style()
         try:
             style.theme_use('clam')
         except Exception:
             pass
 
-        style.configure(
-            "Modern.Treeview",
-            background="#ffffff",
-            foreground="#333333",
-            fieldbackground="#ffffff",
-            rowheight=24,
-            font=("Arial", 10),
-        )
-        style.configure(
-            "Modern.Treeview.Heading",
-            background="#003366",
-            foreground="#ffffff",
-            font=("Arial", 10, "bold"),
-        )
-        style.map("Modern.Treeview", background=[('selected', '#b3d7ff')])
+        for name, rowheight, size in (("Modern", 24, 10), ("Stats", 22, 9), ("Settings", 22, 9)):
+            style.configure(
+                f"{name}.Treeview",
+                background="#ffffff",
+                foreground="#333333",
+                fieldbackground="#ffffff",
+                rowheight=rowheight,
+                font=("Arial", size),
+            )
+            style.configure(
+                f"{name}.Treeview.Heading",
+                background="#003366",
+                foreground="#ffffff",
+                font=("Arial", size, "bold"),
+            )
+            style.map(f"{name}.Treeview", background=[('selected', '#b3d7ff')])
+
+    def create_widgets(self) -> None:
+        self._init_styles()
 
         controls_frame = tk.Frame(self.root, bg="#00366f")
         controls_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -158,11 +414,11 @@ class CoordinationApp:
         load_btn = make_button(controls_frame, "Load Excel", self.load_excel)
         load_btn.pack(side=tk.LEFT, padx=(0, 5))
 
-        publish_btn = make_button(controls_frame, "Publish", self.publish_to_firebase, bg="#28a745")
-        publish_btn.pack(side=tk.LEFT, padx=5)
+        self.publish_btn = make_button(controls_frame, "Publish", self.publish_to_firebase, bg="#28a745")
+        self.publish_btn.pack(side=tk.LEFT, padx=5)
 
-        stats_btn = make_button(controls_frame, "Flight Stats", self.show_stats, bg="#17a2b8")
-        stats_btn.pack(side=tk.LEFT, padx=5)
+        self.stats_btn = make_button(controls_frame, "Flight Stats", self.show_stats, bg="#17a2b8")
+        self.stats_btn.pack(side=tk.LEFT, padx=5)
 
         settings_btn = make_button(controls_frame, "Settings", self.open_settings, bg="#ffc107", fg="#333333")
         settings_btn.pack(side=tk.LEFT, padx=5)
@@ -231,7 +487,16 @@ class CoordinationApp:
 
         vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
         hsb = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+
+        def on_tree_yscroll(first, last):
+            vsb.set(first, last)
+            # Load the next page once the view nears the end of the rows shown.
+            if (float(last) > 0.9 and not self._tree_page_pending
+                    and self._tree_rows_shown < len(self.flight_records)):
+                self._tree_page_pending = True
+                self.root.after_idle(self.load_more_rows)
+
+        self.tree.configure(yscrollcommand=on_tree_yscroll, xscrollcommand=hsb.set)
 
         self.tree.grid(row=0, column=0, sticky="nsew")
         vsb.grid(row=0, column=1, sticky="ns")
@@ -246,30 +511,122 @@ class CoordinationApp:
         if firebase_admin is None or not FIREBASE_CRED_FILE or not FIREBASE_DB_URL:
             return
         try:
+            self._ensure_firebase_app()
+        except Exception as e:
+            messagebox.showerror("Firebase Error", f"Failed to initialize Firebase: {e}")
+
+    def _ensure_firebase_app(self) -> None:
+        # May be reached from the Tk thread and from worker threads.
+        with self._firebase_lock:
             if not firebase_admin._apps:
                 cred = credentials.Certificate(FIREBASE_CRED_FILE)
                 firebase_admin.initialize_app(cred, {"databaseURL": FIREBASE_DB_URL})
-        except Exception as e:
-            messagebox.showerror("Firebase Error", f"Failed to initialize Firebase: {e}")
+
+    def _get_flights_ref(self):
+        if self._flights_ref is None:
+            self._ensure_firebase_app()
+            self._flights_ref = db.reference('/flights')
+        return self._flights_ref
+
+    def _get_ops_ref(self):
+        if self._ops_ref is None:
+            self._ensure_firebase_app()
+            self._ops_ref = db.reference('/flightOperations')
+        return self._ops_ref
+
+    def _get_airlines_ref(self):
+        if self._airlines_ref is None:
+            self._ensure_firebase_app()
+            self._airlines_ref = db.reference('/airlineInstructions')
+        return self._airlines_ref
+
+    # ------------- background work -------------
+    def run_in_background(self, work, done, executor: Optional[ThreadPoolExecutor] = None) -> None:
+        """
+        Run work() on a worker thread (or on executor) and call done(future)
+        on the Tk thread once it has finished.  Workers never touch Tk: the
+        future is polled with root.after from the Tk thread, which works
+        whether or not Tcl was built with thread support.
+        """
+        if executor is not None:
+            future = executor.submit(work)
+        else:
+            future = Future()
+
+            def run():
+                try:
+                    future.set_result(work())
+                except Exception as e:
+                    future.set_exception(e)
+
+            # A daemon thread, so a slow fetch does not hold up closing the app
+            threading.Thread(target=run, daemon=True).start()
+        self._wait_for(future, done)
+
+    def _wait_for(self, future: Future, done) -> None:
+        if future.done():
+            done(future)
+        else:
+            self.root.after(BACKGROUND_POLL_MS, self._wait_for, future, done)
 
     def load_existing_flights(self) -> None:
+        """Fetch /flights in a background thread and show them when ready.
+
+        Only flights whose STA or STD falls in the selected period are
+        requested (server-side range queries, which need the /flights
+        ".indexOn" in database.rules.json); if a query fails the whole node
+        is fetched and filtered locally.
+        """
         if firebase_admin is None or not FIREBASE_CRED_FILE or not FIREBASE_DB_URL:
             return
+        generation = self._records_generation
+        self._flights_request += 1
+        request = self._flights_request
+        bounds = self.period_bounds(self.filter_type, self.filter_date)
+
+        def fetch():
+            flights_ref = self._get_flights_ref()
+            data = None
+            loaded = bounds
+            if bounds is not None:
+                try:
+                    # Originating departures have an STD but no STA, so
+                    # both columns are queried and merged by flight key.
+                    data = {}
+                    for child in ('std', 'sta'):
+                        query = flights_ref.order_by_child(child).start_at(bounds[0]).end_at(bounds[1])
+                        data.update(query.get() or {})
+                except Exception as ex:
+                    data = None
+                    print(f"Range query on /flights failed, fetching all flights: {ex}")
+            if data is None:
+                data = flights_ref.get()
+                loaded = None
+            return data or {}, loaded
+
+        def fetched(future):
+            try:
+                data, loaded = future.result()
+            except Exception as ex:
+                print(f"Error loading existing flights: {ex}")
+                return
+            self.show_existing_flights(data, generation, request, loaded)
+
+        self.run_in_background(fetch, fetched)
+
+    def show_existing_flights(self, data: dict, generation: int, request: int, loaded: Optional[tuple]) -> None:
+        # A newer fetch (or a locally loaded flight list) supersedes this one
+        if generation != self._records_generation or request != self._flights_request:
+            return
         try:
-            if not firebase_admin._apps:
-                cred = credentials.Certificate(FIREBASE_CRED_FILE)
-                firebase_admin.initialize_app(cred, {"databaseURL": FIREBASE_DB_URL})
-            flights_ref = db.reference('/flights')
-            data = flights_ref.get() or {}
+            # Collect the ISO strings first and convert them with one
+            # pd.to_datetime call per column rather than one per flight.
+            infos = [info for info in data.values() if isinstance(info, dict)]
+            stas = _to_timestamps([info.get('sta') or None for info in infos])
+            stds = _to_timestamps([info.get('std') or None for info in infos])
             records: List[FlightRecord] = []
-            for flight_id, info in data.items():
-                if not isinstance(info, dict):
-                    continue
+            for info, sta, std in zip(infos, stas, stds):
                 flight_num = info.get('flightNumber', '') or info.get('flight', '') or ''
-                sta_iso = info.get('sta', '') or ''
-                std_iso = info.get('std', '') or ''
-                sta = pd.to_datetime(sta_iso) if sta_iso else pd.NaT
-                std = pd.to_datetime(std_iso) if std_iso else pd.NaT
                 registration = info.get('registration', '') or ''
                 aircraft_type = info.get('aircraftType', '') or ''
                 airline_name = info.get('airline', '') or ''
@@ -278,8 +635,8 @@ class CoordinationApp:
                 eta = info.get('eta', '') or ''
                 parking = info.get('parking', '') or ''
                 airline_code = info.get('airlineCode', '') or self.get_airline_code(flight_num)
-                if not airline_name and self.airline_settings.get(airline_code):
-                    airline_name = self.airline_settings[airline_code].get('name', '')
+                if not airline_name:
+                    airline_name = self._airline_name_map.get(airline_code, '')
 
                 rec = FlightRecord(
                     flight=flight_num,
@@ -296,11 +653,12 @@ class CoordinationApp:
                 )
                 records.append(rec)
 
-            if records:
-                records.sort(key=lambda x: (pd.NaT if pd.isna(x.sta) else x.sta))
-                self.all_flight_records = records
-                self.flight_records = self.filter_records(self.all_flight_records)
-                self.refresh_treeview()
+            edited = self._edited_records
+            if edited:
+                records = [edited.get(self.flight_key(rec), rec) for rec in records]
+            self.all_flight_records = records
+            self._loaded_bounds = loaded
+            self.show_filtered_records()
         except Exception as ex:
             print(f"Error loading existing flights: {ex}")
 
@@ -314,36 +672,19 @@ class CoordinationApp:
             return
         try:
             records = self.parse_excel(path)
-            records.sort(key=lambda x: (pd.NaT if pd.isna(x.sta) else x.sta))
-            self.all_flight_records = records
-            self.flight_records = self.filter_records(self.all_flight_records)
         except Exception as e:
             messagebox.showerror("Error loading file", f"Failed to load Excel file: {e}")
             return
-        self.refresh_treeview()
+        self._records_generation += 1
+        self._records_from_firebase = False
+        self._edited_records.clear()
+        self.all_flight_records = records
+        self.show_filtered_records()
 
     def parse_excel(self, path: str) -> List[FlightRecord]:
-        try:
-            xls = pd.ExcelFile(path)
-            sheet_name = 'pair_report' if 'pair_report' in xls.sheet_names else xls.sheet_names[0]
-        except Exception:
-            sheet_name = 0
-
-        raw = pd.read_excel(path, sheet_name=sheet_name, header=None)
-        header_row_idx = None
-        for i in range(min(30, len(raw))):
-            row_vals = [str(x).strip().upper() if pd.notna(x) else "" for x in raw.iloc[i].tolist()]
-            has_flight = any("FLIGHT" in val for val in row_vals)
-            has_sta = any(any(cand in val for cand in ["STA", "ARR", "ARRIVAL"]) for val in row_vals)
-            has_std = any(any(cand in val for cand in ["STD", "DEP", "DEPARTURE", "ETD"]) for val in row_vals)
-            if has_flight and (has_sta or has_std):
-                header_row_idx = i
-                break
-
-        if header_row_idx is not None:
-            df = pd.read_excel(path, sheet_name=sheet_name, header=header_row_idx)
-        else:
-            df = pd.read_excel(path, sheet_name=sheet_name, header=0)
+        df = self.read_flight_table(path)
+        if df is None:
+            df = self.read_flight_sheet(path)
 
         columns_upper = [str(col).strip().upper() for col in df.columns]
 
@@ -378,87 +719,233 @@ class CoordinationApp:
         sta_series = pd.to_datetime(df[sta_col], errors="coerce", dayfirst=True) if sta_col else pd.Series([pd.NaT] * len(df))
         std_series = pd.to_datetime(df[dep_col], errors="coerce", dayfirst=True) if dep_col else pd.Series([pd.NaT] * len(df))
 
-        records: List[FlightRecord] = []
-        for i, row in df.iterrows():
-            flight = str(row[flight_col]).strip() if pd.notna(row[flight_col]) else ""
-            if not flight:
-                continue
-            sta = sta_series.iloc[i]
-            std = std_series.iloc[i]
-            registration = str(row[reg_col]).strip() if reg_col and pd.notna(row.get(reg_col)) else ""
-            aircraft_type = str(row[type_col]).strip() if type_col and pd.notna(row.get(type_col)) else ""
-            airline = str(row[airline_col]).strip() if airline_col and pd.notna(row.get(airline_col)) else ""
-
-            eta = ""
-            if eta_col and pd.notna(row.get(eta_col)):
-                eta_val = row.get(eta_col)
-                if isinstance(eta_val, (pd.Timestamp,)):
-                    eta = eta_val.strftime("%Y-%m-%d %H:%M")
-                else:
-                    eta = str(eta_val).strip()
-
-            parking = ""
-            if parking_col and pd.notna(row.get(parking_col)):
-                parking = str(row.get(parking_col)).strip()
-
-            airline_code = self.get_airline_code(flight)
-            mapped_name = None
-            if hasattr(self, 'airline_settings') and self.airline_settings:
-                mapping = self.airline_settings.get(airline_code)
-                if mapping:
-                    mapped_name = mapping.get('name', None)
-
-            if airline:
-                airline_name = airline
-            elif mapped_name:
-                airline_name = mapped_name
-            else:
-                airline_name = ""
-
-            rec = FlightRecord(
-                flight=flight,
-                sta=sta,
-                std=std,
-                registration=registration,
-                aircraft_type=aircraft_type,
-                airline=airline_name,
-                eta=eta,
-                parking=parking,
-                airline_code=airline_code,
-            )
-            records.append(rec)
+        # Clean every text column in one pass over the column subset.
+        text_cols = list(dict.fromkeys(c for c in (flight_col, reg_col, type_col, airline_col, parking_col, eta_col) if c is not None))
+        text = df[text_cols].astype("string").apply(lambda s: s.str.strip()).fillna("")
+        empty = pd.Series("", index=df.index, dtype="string")
 
-        records.sort(key=lambda x: (pd.NaT if pd.isna(x.sta) else x.sta))
+        def text_column(col: Optional[str]) -> pd.Series:
+            return text[col] if col is not None else empty
+
+        flight_s = text_column(flight_col)
+        if eta_col and pd.api.types.is_datetime64_any_dtype(df[eta_col]):
+            eta_s = df[eta_col].dt.strftime(DISPLAY_TIME_FORMAT).fillna("")
+        else:
+            eta_s = text_column(eta_col)
+
+        # Airline code is the alphabetic prefix of the flight number (see
+        # _airline_code); fall back to the configured airline name when the
+        # sheet has no airline column value.
+        code_s = flight_s.map(_airline_code)
+        airline_s = text_column(airline_col)
+        airline_s = airline_s.where(airline_s != "", code_s.map(self._airline_name_map).fillna(""))
+
+        # Columns in FlightRecord field order (slot and flight plan are
+        # filled in by the coordinator later).
+        record_cols = pd.DataFrame({
+            'flight': flight_s,
+            'sta': sta_series,
+            'std': std_series,
+            'registration': text_column(reg_col),
+            'aircraft_type': text_column(type_col),
+            'airline': airline_s,
+            'slot': empty,
+            'flight_plan': empty,
+            'eta': eta_s,
+            'parking': text_column(parking_col),
+            'airline_code': code_s,
+        })
+        record_cols = record_cols[(flight_s != "").to_numpy()]
+        records: List[FlightRecord] = [
+            FlightRecord(*values) for values in record_cols.itertuples(index=False, name=None)
+        ]
         return records
 
+    def read_flight_table(self, path: str) -> Optional[pd.DataFrame]:
+        """Return the first Excel table (ListObject) with a FLIGHT column.
+
+        Reading a defined table gives the header directly, so no header
+        row has to be searched for.  Returns None when calamine is not
+        available or the workbook defines no such table.
+        """
+        if python_calamine is None:
+            return None
+        try:
+            wb = python_calamine.CalamineWorkbook.from_path(path, load_tables=True)
+        except Exception:
+            return None
+        try:
+            for name in wb.table_names:
+                table = wb.get_table_by_name(name)
+                if any("FLIGHT" in str(col).upper() for col in table.columns):
+                    # Same cell conversion as pandas' calamine reader:
+                    # blank cells become missing, whole floats become int.
+                    rows = [
+                        [None if v == "" else int(v) if isinstance(v, float) and v.is_integer() else v for v in row]
+                        for row in table.to_python()
+                    ]
+                    return pd.DataFrame(rows, columns=self.make_column_names(table.columns)).infer_objects()
+        except Exception:
+            return None
+        finally:
+            wb.close()
+        return None
+
+    def read_flight_sheet(self, path: str) -> pd.DataFrame:
+        """Read the flight sheet and use the detected header row for column names."""
+        # Read the sheet once without a header; the header row is located
+        # on the in-memory frame instead of re-parsing the workbook.
+        raw = self.read_sheet(path)
+        header_row_idx = None
+        for i in range(min(30, len(raw))):
+            row_vals = [str(x).strip().upper() if pd.notna(x) else "" for x in raw.iloc[i].tolist()]
+            has_flight = any("FLIGHT" in val for val in row_vals)
+            has_sta = any(any(cand in val for cand in ["STA", "ARR", "ARRIVAL"]) for val in row_vals)
+            has_std = any(any(cand in val for cand in ["STD", "DEP", "DEPARTURE", "ETD"]) for val in row_vals)
+            if has_flight and (has_sta or has_std):
+                header_row_idx = i
+                break
+        if header_row_idx is None:
+            header_row_idx = 0
+
+        df = raw.iloc[header_row_idx + 1:].reset_index(drop=True)
+        df.columns = self.make_column_names(raw.iloc[header_row_idx].tolist()) if len(raw) else []
+        df = df.infer_objects()
+        return df
+
+    @staticmethod
+    def read_sheet(path: str) -> pd.DataFrame:
+        """Return the pair_report sheet (or the first sheet) without a header."""
+        if python_calamine is None and path.lower().endswith('.xlsx'):
+            # Stream rows in read-only mode rather than building the full
+            # workbook (styles, formulas) in memory.
+            from openpyxl import load_workbook
+            wb = load_workbook(path, read_only=True, data_only=True)
+            try:
+                ws = wb['pair_report'] if 'pair_report' in wb.sheetnames else wb.worksheets[0]
+                rows = list(ws.iter_rows(values_only=True))
+            finally:
+                wb.close()
+            return pd.DataFrame(rows)
+        engine = 'calamine' if python_calamine is not None else None
+        with pd.ExcelFile(path, engine=engine) as xls:
+            sheet_name = 'pair_report' if 'pair_report' in xls.sheet_names else xls.sheet_names[0]
+            return xls.parse(sheet_name, header=None)
+
+    @staticmethod
+    def make_column_names(header: list) -> List[str]:
+        """Name columns from a header row the way pd.read_excel does
+        (blank cells become "Unnamed: i", duplicates get ".1", ".2" ...)."""
+        names: List[str] = []
+        seen: Dict[str, int] = {}
+        for i, val in enumerate(header):
+            name = str(val) if pd.notna(val) else f"Unnamed: {i}"
+            if name in seen:
+                seen[name] += 1
+                name = f"{name}.{seen[name]}"
+            else:
+                seen[name] = 0
+            names.append(name)
+        return names
+
     # ------------- filtering / refresh -------------
+    def show_filtered_records(self) -> None:
+        # Filter first so only the displayed subset needs sorting;
+        # all_flight_records itself is kept in load order.
+        records = self.filter_records(self.all_flight_records)
+        records.sort(key=lambda x: (pd.NaT if pd.isna(x.sta) else x.sta))
+        self.flight_records = records
+        self.refresh_treeview()
+
+    @staticmethod
+    def tree_values(rec: FlightRecord) -> tuple:
+        return (
+            rec.flight,
+            rec.sta_display,
+            rec.std_display,
+            rec.eta or "",
+            rec.registration,
+            rec.aircraft_type,
+            rec.airline,
+            rec.slot,
+            rec.flight_plan,
+            rec.parking,
+        )
+
     def refresh_treeview(self) -> None:
-        for row in self.tree.get_children():
-            self.tree.delete(row)
-        for idx, rec in enumerate(self.flight_records):
-            sta_str = rec.sta.strftime("%Y-%m-%d %H:%M") if pd.notna(rec.sta) else ""
-            std_str = rec.std.strftime("%Y-%m-%d %H:%M") if pd.notna(rec.std) else ""
-            eta_str = rec.eta or ""
-            values = (
-                rec.flight,
-                sta_str,
-                std_str,
-                eta_str,
-                rec.registration,
-                rec.aircraft_type,
-                rec.airline,
-                rec.slot,
-                rec.flight_plan,
-                rec.parking,
-            )
-            self.tree.insert("", "end", iid=str(idx), values=values)
+        # Only touch rows that were added, changed or removed since the
+        # previous refresh instead of rebuilding the whole tree.  Rows are
+        # materialised a page at a time; at least as many as were already
+        # shown are kept so the scroll position survives a refresh.
+        old_state = self._tree_row_state
+        new_state: Dict[str, tuple] = {}
+        shown = min(len(self.flight_records), max(self._tree_rows_shown, TREE_PAGE_SIZE))
+        for idx in range(shown):
+            values = self.tree_values(self.flight_records[idx])
+            iid = str(idx)
+            new_state[iid] = values
+            current = old_state.get(iid)
+            if current is None:
+                self.tree.insert("", "end", iid=iid, values=values)
+            elif current != values:
+                self.tree.item(iid, values=values)
+        stale = [iid for iid in old_state if iid not in new_state]
+        if stale:
+            self.tree.delete(*stale)
+        self._tree_row_state = new_state
+        self._tree_rows_shown = shown
+
+    def load_more_rows(self) -> None:
+        self._tree_page_pending = False
+        start = self._tree_rows_shown
+        end = min(len(self.flight_records), start + TREE_PAGE_SIZE)
+        for idx in range(start, end):
+            values = self.tree_values(self.flight_records[idx])
+            iid = str(idx)
+            self.tree.insert("", "end", iid=iid, values=values)
+            self._tree_row_state[iid] = values
+        self._tree_rows_shown = end
 
     def filter_records(self, records: List[FlightRecord]) -> List[FlightRecord]:
         ftype = getattr(self, 'filter_type', 'All')
         fdate = getattr(self, 'filter_date', None)
         if ftype == 'All' or fdate is None:
             return list(records)
+        try:
+            # Reference time is STA, falling back to STD; compare whole
+            # columns with the .dt accessors instead of record by record.
+            sta = pd.Series(pd.DatetimeIndex([rec.sta for rec in records]))
+            std = pd.Series(pd.DatetimeIndex([rec.std for rec in records]))
+            ref = sta.fillna(std)
+            if not pd.api.types.is_datetime64_any_dtype(ref):
+                # aware STAs filled from naive STDs give an object column
+                raise TypeError("mixed timestamp types")
+            if ref.dt.tz is not None:
+                ref = ref.dt.tz_localize(None)
+        except (TypeError, ValueError):
+            # e.g. a mix of timezone-aware and naive timestamps
+            return self.filter_records_by_row(records, ftype, fdate)
+        if ftype == 'Day':
+            mask = (ref.dt.year == fdate.year) & (ref.dt.month == fdate.month) & (ref.dt.day == fdate.day)
+        elif ftype == 'Week':
+            iso = ref.dt.isocalendar()
+            fyear, fweek = fdate.isocalendar()[:2]
+            mask = ((iso['year'] == fyear) & (iso['week'] == fweek)).fillna(False)
+        elif ftype == 'Month':
+            mask = (ref.dt.year == fdate.year) & (ref.dt.month == fdate.month)
+        elif ftype == 'Year':
+            mask = ref.dt.year == fdate.year
+        else:
+            return []
+        return [rec for rec, keep in zip(records, mask.tolist()) if keep]
+
+    def filter_records_by_row(self, records: List[FlightRecord], ftype: str, fdate) -> List[FlightRecord]:
         filtered: List[FlightRecord] = []
+        # Period invariants, computed once instead of per record. An ISO week
+        # is the Monday-to-Sunday span containing fdate.
+        fyear, fmonth = fdate.year, fdate.month
+        week_start = fdate - timedelta(days=fdate.weekday())
+        week_end = week_start + timedelta(days=7)
         for rec in records:
             dt = None
             try:
@@ -474,16 +961,40 @@ class CoordinationApp:
                 if dt == fdate:
                     filtered.append(rec)
             elif ftype == 'Week':
-                if dt.isocalendar()[:2] == fdate.isocalendar()[:2]:
+                if week_start <= dt < week_end:
                     filtered.append(rec)
             elif ftype == 'Month':
-                if dt.year == fdate.year and dt.month == fdate.month:
+                if dt.year == fyear and dt.month == fmonth:
                     filtered.append(rec)
             elif ftype == 'Year':
-                if dt.year == fdate.year:
+                if dt.year == fyear:
                     filtered.append(rec)
         return filtered
 
+    @staticmethod
+    def period_bounds(ftype: str, fdate) -> Optional[tuple]:
+        """Return (start, end) ISO date strings covering the period, or None for All.
+
+        STA values are stored as ISO datetimes, so every STA in the period
+        sorts between start and end (the first day after the period).
+        """
+        if fdate is None:
+            return None
+        if ftype == 'Day':
+            start, end = fdate, fdate + timedelta(days=1)
+        elif ftype == 'Week':
+            start = fdate - timedelta(days=fdate.weekday())
+            end = start + timedelta(days=7)
+        elif ftype == 'Month':
+            start = fdate.replace(day=1)
+            end = start.replace(year=start.year + 1, month=1) if start.month == 12 else start.replace(month=start.month + 1)
+        elif ftype == 'Year':
+            start = fdate.replace(month=1, day=1)
+            end = start.replace(year=start.year + 1)
+        else:
+            return None
+        return start.isoformat(), end.isoformat()
+
     def apply_filter(self) -> None:
         if hasattr(self, 'filter_type_var'):
             self.filter_type = self.filter_type_var.get()
@@ -494,8 +1005,21 @@ class CoordinationApp:
             except Exception:
                 messagebox.showwarning("Date Format", "Please enter date as YYYY-MM-DD.")
                 return
-        self.flight_records = self.filter_records(self.all_flight_records)
-        self.refresh_treeview()
+        if (self._records_from_firebase and firebase_admin is not None and FIREBASE_CRED_FILE and FIREBASE_DB_URL
+                and not self._loaded_covers(self.period_bounds(self.filter_type, self.filter_date))):
+            self.load_existing_flights()
+        else:
+            # Anything still being fetched was for an earlier filter
+            self._flights_request += 1
+            self.show_filtered_records()
+
+    def _loaded_covers(self, bounds: Optional[tuple]) -> bool:
+        """Whether the flights already fetched from Firebase span bounds."""
+        loaded = self._loaded_bounds
+        if loaded is None:
+            # Everything was fetched, unless nothing has been yet
+            return bool(self.all_flight_records)
+        return bounds is not None and loaded[0] <= bounds[0] and bounds[1] <= loaded[1]
 
     # ------------- editing -------------
     def on_double_click(self, event) -> None:
@@ -535,10 +1059,13 @@ class CoordinationApp:
                 rec.flight_plan = new_value
             elif col_index == 9:
                 rec.parking = new_value
+            if self._records_from_firebase:
+                self._edited_records[self.flight_key(rec)] = rec
 
             values = list(self.tree.item(row_id, "values"))
             values[col_index] = new_value
             self.tree.item(row_id, values=values)
+            self._tree_row_state[row_id] = tuple(values)
             entry.destroy()
 
         def on_escape(event):
@@ -555,55 +1082,67 @@ class CoordinationApp:
                 "Firebase credentials or URL missing. Please configure FIREBASE_CRED_FILE and FIREBASE_DB_URL in the script.",
             )
             return
-        if not firebase_admin._apps:
-            try:
-                cred = credentials.Certificate(FIREBASE_CRED_FILE)
-                firebase_admin.initialize_app(cred, {"databaseURL": FIREBASE_DB_URL})
-            except Exception as e:
-                messagebox.showerror("Firebase Error", f"Failed to initialize Firebase: {e}")
-                return
         try:
-            flights_ref = db.reference("/flights")
-            count = 0
-            for rec in self.flight_records:
-                flight_id = f"{rec.flight.replace(' ', '')}_{rec.sta.strftime('%Y%m%d') if pd.notna(rec.sta) else ''}"
-                data = rec.to_firebase_dict()
-                update_dict = {}
-                for k, v in data.items():
-                    if k == "eta":
-                        update_dict[k] = v
-                    else:
-                        if v not in (None, ""):
-                            update_dict[k] = v
-                flights_ref.child(flight_id).update(update_dict)
-                count += 1
-            messagebox.showinfo("Success", f"Uploaded {count} flights to Firebase.")
+            flights_ref = self._get_flights_ref()
         except Exception as e:
-            messagebox.showerror("Upload Error", f"Failed to upload to Firebase: {e}")
+            messagebox.showerror("Firebase Error", f"Failed to initialize Firebase: {e}")
+            return
+        # Collect every field as a "<flight_id>/<field>" path so all
+        # flights are written in a single multi-path update.
+        big_update = {}
+        count = 0
+        for rec in self.flight_records:
+            flight_id = self.flight_key(rec)
+            data = rec.to_firebase_dict()
+            for k, v in data.items():
+                if k == "eta":
+                    big_update[f"{flight_id}/{k}"] = v
+                else:
+                    if v not in (None, ""):
+                        big_update[f"{flight_id}/{k}"] = v
+            count += 1
+
+        # The network write runs in a worker thread so the window stays
+        # responsive; the result is reported back on the Tk thread.
+        self.publish_btn.configure(state=tk.DISABLED)
+
+        def upload():
+            if big_update:
+                flights_ref.update(big_update)
+
+        def uploaded(future):
+            error = future.exception()
+            self.publish_finished(count if error is None else None, error)
+
+        self.run_in_background(upload, uploaded)
+
+    @staticmethod
+    def flight_key(rec: FlightRecord) -> str:
+        """Firebase key of a flight, "<flight>_<YYYYMMDD>"."""
+        # The date is built from the integer fields rather than a strftime
+        # call per flight.
+        sta = rec.sta
+        day_key = f"{sta.year:04d}{sta.month:02d}{sta.day:02d}" if pd.notna(sta) else ''
+        return f"{rec.flight.replace(' ', '')}_{day_key}"
+
+    def publish_finished(self, count: Optional[int], error: Optional[Exception]) -> None:
+        self.publish_btn.configure(state=tk.NORMAL)
+        if error is not None:
+            messagebox.showerror("Upload Error", f"Failed to upload to Firebase: {error}")
+        else:
+            messagebox.showinfo("Success", f"Uploaded {count} flights to Firebase.")
 
     # ------------- airline settings -------------
     def get_airline_code(self, flight_number: str) -> str:
         if not flight_number:
             return ""
-        prefix = ""
-        for ch in flight_number:
-            if ch.isalpha():
-                prefix += ch
-            else:
-                break
-        if len(prefix) >= 3:
-            return prefix[:3].upper()
-        elif len(prefix) >= 2:
-            return prefix[:2].upper()
-        else:
-            return prefix.upper()
+        return _airline_code(flight_number)
 
     def load_airline_settings(self) -> None:
-        settings_path = os.path.join(os.path.dirname(__file__), 'airline_settings.json')
-        if os.path.exists(settings_path):
+        if os.path.exists(SETTINGS_PATH):
             try:
-                with open(settings_path, 'r', encoding='utf-8') as f:
-                    self.airline_settings = json.load(f)
+                with open(SETTINGS_PATH, 'rb') as f:
+                    self.airline_settings = _json_loads(f.read())
             except Exception:
                 self.airline_settings = {}
         else:
@@ -617,40 +1156,162 @@ class CoordinationApp:
                     'types': {}
                 }
             else:
-                if 'types' not in data:
-                    data['types'] = {}
+                data.setdefault('types', {})
+        self._sorted_airline_codes = sorted(self.airline_settings)
+        self._rebuild_airline_name_map()
+
+    def _rebuild_airline_name_map(self) -> None:
+        self._airline_name_map = {
+            code: data.get('name', '') or '' for code, data in self.airline_settings.items()
+        }
+
+    def airline_list(self) -> List[tuple]:
+        """(code, name) of every configured airline, sorted by code."""
+        names = self._airline_name_map
+        return [(code, names.get(code, '')) for code in self._sorted_airline_codes]
+
+    def add_airline_code(self, code: str) -> None:
+        """Record a newly configured airline code."""
+        bisect.insort(self._sorted_airline_codes, code)
+
+    def remove_airline_code(self, code: str) -> None:
+        """Forget a deleted airline code."""
+        codes = self._sorted_airline_codes
+        i = bisect.bisect_left(codes, code)
+        if i < len(codes) and codes[i] == code:
+            del codes[i]
+
+    def schedule_save_airline_settings(self) -> None:
+        """
+        Queue save_airline_settings() to run once the settings have been
+        left alone for SETTINGS_SAVE_DELAY_MS, so a run of edits (e.g.
+        several deletions) is written and uploaded once.
+        """
+        if self._settings_save_job is not None:
+            self.root.after_cancel(self._settings_save_job)
+        self._settings_save_job = self.root.after(SETTINGS_SAVE_DELAY_MS, self._run_queued_save)
+
+    def _run_queued_save(self) -> None:
+        self._settings_save_job = None
+        self.save_airline_settings()
+
+    def flush_airline_settings(self) -> None:
+        """Run a queued settings save now, if there is one."""
+        if self._settings_save_job is not None:
+            self.save_airline_settings()
 
     def save_airline_settings(self) -> None:
-        settings_path = os.path.join(os.path.dirname(__file__), 'airline_settings.json')
-        try:
-            with open(settings_path, 'w', encoding='utf-8') as f:
-                json.dump(self.airline_settings, f, indent=2)
-        except Exception as e:
-            messagebox.showerror("Save Error", f"Failed to write airline settings: {e}")
+        # This save covers anything still queued.
+        if self._settings_save_job is not None:
+            self.root.after_cancel(self._settings_save_job)
+            self._settings_save_job = None
+        self._rebuild_airline_name_map()
+        # Snapshot the settings on the Tk thread; the file write and upload
+        # then run on the save worker so the window stays responsive.
+        payload = _json_dumps(self.airline_settings)
+        # Nothing changed since the last save (e.g. deleting something that
+        # was already gone), so skip the write and upload.
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        if digest == self._last_saved_hash:
             return
-
-        if firebase_admin is not None and self.airline_settings:
+        self._last_saved_hash = digest
+        dirty, self._dirty_settings_keys = self._dirty_settings_keys, set()
+        upload = None
+        full = not self._settings_uploaded
+        if firebase_admin is not None and (self.airline_settings if full else dirty):
             try:
-                if not firebase_admin._apps:
-                    cred = credentials.Certificate(FIREBASE_CRED_FILE)
-                    firebase_admin.initialize_app(cred, {"databaseURL": FIREBASE_DB_URL})
-                instructions_data = {}
-                for code, data in self.airline_settings.items():
-                    entry = {
-                        'name': data.get('name', ''),
-                        'instructions': data.get('instructions', ''),
-                        'layoutUrl': data.get('layoutUrl', ''),
-                        'types': {}
+                if full:
+                    upload = {
+                        code: _airline_upload_entry(data) for code, data in self.airline_settings.items()
                     }
-                    for typ, tdata in data.get('types', {}).items():
-                        entry['types'][typ] = {
-                            'instructions': tdata.get('instructions', ''),
-                            'layoutUrl': tdata.get('layoutUrl', '')
-                        }
-                    instructions_data[code] = entry
-                db.reference('/airlineInstructions').set(instructions_data)
+                else:
+                    upload = self._airline_settings_delta(dirty)
+                self._settings_uploaded = True
             except Exception as e:
+                upload = None
+                self._last_saved_hash = None
+                self._settings_uploaded = False
                 messagebox.showwarning("Firebase Warning", f"Failed to upload airline instructions: {e}")
+        self._save_seq += 1
+        seq = self._save_seq
+        if upload is not None and full:
+            self._full_upload_seq = seq
+        self.run_in_background(
+            lambda: self._write_airline_settings(payload, upload, full),
+            lambda future: self._save_finished(future, seq),
+            executor=self._save_executor,
+        )
+
+    def _save_finished(self, future: Future, seq: int) -> None:
+        """Handle the outcome of a background settings save (Tk thread)."""
+        problem = future.result()
+        if problem is None:
+            return
+        # A later full upload rewrites the file and replaces the remote
+        # settings, so it makes up for this failure; otherwise save (and
+        # upload) everything next time.
+        if self._full_upload_seq <= seq:
+            self._last_saved_hash = None
+            self._settings_uploaded = False
+        show, title, message = problem
+        show(title, message)
+
+    def _airline_settings_delta(self, dirty) -> dict:
+        """
+        Multi-path update for the changed airlines and types; anything that
+        has since been deleted maps to None, which removes it remotely.
+        """
+        updates = {}
+        for key in dirty:
+            code = key[0]
+            data = self.airline_settings.get(code)
+            if len(key) == 1:
+                updates[code] = None if data is None else _airline_upload_entry(data)
+            else:
+                tdata = data['types'].get(key[1]) if data is not None else None
+                updates[f"{code}/types/{key[1]}"] = None if tdata is None else {
+                    'instructions': tdata.get('instructions', ''),
+                    'layoutUrl': tdata.get('layoutUrl', '')
+                }
+        return updates
+
+    def mark_airline_settings_dirty(self, code: str, typ: Optional[str] = None) -> None:
+        """Note that an airline, or one of its aircraft types, needs uploading."""
+        keys = self._dirty_settings_keys
+        if typ is None:
+            # The airline's own entry covers its types; RTDB also rejects an
+            # update containing both a path and one of its children.
+            keys.difference_update([k for k in keys if k[0] == code])
+            keys.add((code,))
+        elif (code,) not in keys:
+            keys.add((code, typ))
+
+    def _write_airline_settings(self, payload: bytes, upload: Optional[dict], full: bool):
+        """
+        Write one settings snapshot to disk and upload it (save worker).
+        A full upload replaces the remote settings; otherwise upload is a
+        multi-path update.  Returns None, or the (dialog, title, message)
+        to report a failure with; no app state is touched here.
+        """
+        # Written beside the real file and renamed over it, so an interrupted
+        # save never leaves a truncated settings file behind.
+        tmp_path = SETTINGS_PATH + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, SETTINGS_PATH)
+        except Exception as e:
+            return messagebox.showerror, "Save Error", f"Failed to write airline settings: {e}"
+
+        if upload is not None:
+            try:
+                if full:
+                    self._get_airlines_ref().set(upload)
+                else:
+                    self._get_airlines_ref().update(upload)
+            except Exception as e:
+                return messagebox.showwarning, "Firebase Warning", f"Failed to upload airline instructions: {e}"
+        return None
 
     def open_settings(self) -> None:
         SettingsWindow(self, self.airline_settings)
@@ -664,21 +1325,174 @@ class CoordinationApp:
             )
             return
         try:
-            if not firebase_admin._apps:
-                cred = credentials.Certificate(FIREBASE_CRED_FILE)
-                firebase_admin.initialize_app(cred, {"databaseURL": FIREBASE_DB_URL})
+            ops_ref = self._get_ops_ref()
         except Exception as e:
             messagebox.showerror("Firebase Error", f"Failed to initialize Firebase: {e}")
             return
+        self.stats_btn.configure(state=tk.DISABLED)
+
+        def fetched(future):
+            error = future.exception()
+            self.stats_fetched(future.result() if error is None else None, error)
+
+        self.run_in_background(lambda: ops_ref.get() or {}, fetched)
+
+    def stats_fetched(self, ops_data: Optional[dict], error: Optional[Exception]) -> None:
+        self.stats_btn.configure(state=tk.NORMAL)
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to fetch stats: {error}")
+            return
         try:
-            ops_ref = db.reference("/flightOperations")
-            ops_data = ops_ref.get() or {}
             StatsWindow(self.root, ops_data, self.airline_settings)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to fetch stats: {e}")
 
 
 
+# Bit of each checklist item in FlightColumns.checklist; the four safety
+# checks occupy the low nibble.
+CHECKLIST_BITS = {'chocks': 1, 'cones': 2, 'fod': 4, 'security': 8, 'toilet': 16, 'water': 32}
+SAFETY_MASK = 0x0F
+# Number of set bits for every byte value
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+# Yes/No text of a checklist flag, indexed by the flag (0 or 1)
+_YN = np.array(['No', 'Yes'])
+_CHECKLIST_BIT_VALUES = np.array(list(CHECKLIST_BITS.values()), dtype=np.uint8)
+
+# Turnaround sub-operations, in display order
+_TURN_OPS = ('unloading', 'disembarking', 'cleaning', 'loading', 'boarding')
+# (title, key, colour) of the KPI cards on the Checklists and Turnaround tabs
+_CHECKLIST_CARD_SPEC = (
+    ('Chocks', 'chocks', '#007bff'),
+    ('Cones', 'cones', '#17a2b8'),
+    ('FOD', 'fod', '#28a745'),
+    ('Security', 'security', '#20c997'),
+    ('Toilet', 'toilet', '#ffc107'),
+    ('Water', 'water', '#dc3545'),
+)
+_TURN_OP_CARD_SPEC = tuple((f"Avg {op.capitalize()}", op, '#6f42c1') for op in _TURN_OPS)
+# Column layout of each StatsWindow table: name -> (((heading, width), ...),
+# virtual).  Virtual tables switch to the canvas table past
+# CANVAS_TABLE_MIN_ROWS rows.
+_TABLE_LAYOUTS = {
+    'services_duration': ((('Flight', 140), ('Airline', 120), ('Start', 140), ('Finish', 140), ('Duration', 90)), False),
+    'services_request': ((('Flight', 140), ('Airline', 120), ('Requested', 80)), False),
+    'services_duration_summary': ((('Code', 80), ('Airline', 120), ('Flights', 80), ('Avg Time', 90)), False),
+    'services_request_summary': ((('Code', 80), ('Airline', 120), ('Requests', 80)), False),
+    'checklist': ((('Flight', 140), ('Airline', 120), ('Chocks', 70), ('Cones', 70), ('FOD', 70), ('Security', 80),
+                   ('Toilet', 70), ('Water', 70), ('Door Open', 140), ('Door Close', 140)), True),
+    'checklist_summary': ((('Code', 80), ('Airline', 120), ('Flights', 60), ('Chocks %', 80), ('Cones %', 80),
+                           ('FOD %', 80), ('Security %', 90), ('Toilet %', 80), ('Water %', 80)), False),
+    'turnaround': ((('Flight', 140), ('Airline', 120), ('Door Open', 140), ('Door Close', 140), ('Turnaround', 110),
+                    ('Unload', 90), ('Disembark', 110), ('Clean', 90), ('Load', 90), ('Board', 90)), True),
+    'turnaround_summary': ((('Code', 80), ('Airline', 120), ('Flights', 60), ('Avg Turn', 100), ('Avg Unload', 90),
+                            ('Avg Disembark', 110), ('Avg Clean', 90), ('Avg Load', 90), ('Avg Board', 90)), False),
+    'airlines': ((('Code', 80), ('Airline', 140), ('Flights', 60), ('Avg Turnaround', 120), ('Avg GPU', 90),
+                  ('Avg ACU', 90), ('Safety %', 90), ('Avg Clean', 90), ('Avg Board', 90), ('Avg Unload', 90),
+                  ('Avg Disembark', 110), ('Avg Load', 90)), False),
+    'reports': ((('Flight', 140), ('Airline', 140), ('Date', 100), ('Remarks', 400)), False),
+}
+# Stats table columns holding dates/times; they sort chronologically with
+# blank or unparsable cells first.
+_DATE_COLUMNS = frozenset({'Date', 'Door Open', 'Door Close', 'Start', 'Finish'})
+
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _airline_duration_sums(airline_ids, values, n_airlines):
+        """Per-airline count and sum of the non-NaN durations."""
+        counts = np.zeros(n_airlines, dtype=np.int64)
+        sums = np.zeros(n_airlines, dtype=np.float64)
+        for i in range(airline_ids.size):
+            v = values[i]
+            if v == v:
+                counts[airline_ids[i]] += 1
+                sums[airline_ids[i]] += v
+        return counts, sums
+else:
+    def _airline_duration_sums(airline_ids, values, n_airlines):
+        """Per-airline count and sum of the non-NaN durations."""
+        has = ~np.isnan(values)
+        return (np.bincount(airline_ids[has], minlength=n_airlines),
+                np.bincount(airline_ids[has], weights=values[has], minlength=n_airlines))
+
+
+@dataclass(slots=True)
+class FlightColumns:
+    """StatsWindow flight records stored as one array per field.
+
+    Durations are float minutes (NaN when unknown) and the checklist items
+    of each flight are packed into one byte (see CHECKLIST_BITS).  Airlines
+    are factorised: ``airline_id`` indexes into ``airline_codes``, where
+    flights without a code are grouped as 'N/A'.
+    """
+    flight: np.ndarray
+    airline_name: np.ndarray
+    airline_id: np.ndarray
+    gpu_start: np.ndarray
+    gpu_finish: np.ndarray
+    apu_start: np.ndarray
+    apu_finish: np.ndarray
+    door_open: np.ndarray
+    door_close: np.ndarray
+    gpu_duration: np.ndarray
+    apu_duration: np.ndarray
+    turnaround_duration: np.ndarray
+    unloading_duration: np.ndarray
+    disembarking_duration: np.ndarray
+    cleaning_duration: np.ndarray
+    loading_duration: np.ndarray
+    boarding_duration: np.ndarray
+    checklist: np.ndarray
+    airline_codes: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=object))
+
+    @classmethod
+    def from_records(cls, records: List[dict]) -> "FlightColumns":
+        def column(key: str, dtype=object) -> np.ndarray:
+            return np.array([rec[key] for rec in records], dtype=dtype)
+
+        codes = np.array([rec['airline_code'] or 'N/A' for rec in records], dtype=object)
+        airline_id, airline_codes = pd.factorize(codes)
+        return cls(
+            flight=column('flight'),
+            airline_name=column('airline_name'),
+            airline_id=airline_id,
+            gpu_start=column('gpuStart'),
+            gpu_finish=column('gpuFinish'),
+            apu_start=column('apuStart'),
+            apu_finish=column('apuFinish'),
+            door_open=column('doorOpen'),
+            door_close=column('doorClose'),
+            gpu_duration=column('gpuDuration', np.float64),
+            apu_duration=column('apuDuration', np.float64),
+            turnaround_duration=column('turnaroundDuration', np.float64),
+            unloading_duration=column('unloadingDuration', np.float64),
+            disembarking_duration=column('disembarkingDuration', np.float64),
+            cleaning_duration=column('cleaningDuration', np.float64),
+            loading_duration=column('loadingDuration', np.float64),
+            boarding_duration=column('boardingDuration', np.float64),
+            checklist=np.array([
+                sum(bit for item, bit in CHECKLIST_BITS.items() if rec[item]) for rec in records
+            ], dtype=np.uint8),
+            airline_codes=np.asarray(airline_codes, dtype=object),
+        )
+
+    def per_airline(self, mask: np.ndarray) -> np.ndarray:
+        """Number of flights per airline id among those selected by mask."""
+        return np.bincount(self.airline_id[mask], minlength=self.airline_codes.size)
+
+    def done(self, item: str) -> np.ndarray:
+        """Boolean array: whether each flight completed the checklist item."""
+        return (self.checklist & CHECKLIST_BITS[item]) != 0
+
+    def take(self, positions) -> "FlightColumns":
+        """Return the flights at the given positions (airline codes are shared)."""
+        idx = np.asarray(positions, dtype=np.intp)
+        values = {f.name: getattr(self, f.name)[idx] for f in fields(self) if f.name != 'airline_codes'}
+        return FlightColumns(**values, airline_codes=self.airline_codes)
+
+
 # ----------------------- Advanced Statistics Window -----------------------
 class StatsWindow(tk.Toplevel):
     """
@@ -710,12 +1524,20 @@ class StatsWindow(tk.Toplevel):
         # Store provided data
         self.ops_data = ops_data or {}
         self.airline_settings = airline_settings or {}
+        # airline code -> display name (the code itself when not configured)
+        self._airline_name: Dict[str, str] = {
+            code: cfg.get('name', code) for code, cfg in self.airline_settings.items()
+        }
         # Initialize period filter: default to today's day.
         self.period_type_var = tk.StringVar(value="Day")
         self.period_date_var = tk.StringVar(value=datetime.now().strftime("%Y-%m-%d"))
         # Service options
         self.service_options = ["GPU", "ACU", "Toilet", "Water"]
         self.selected_service = tk.StringVar(value=self.service_options[0])
+        # One table builder per fixed layout
+        self._builders = {
+            name: self.make_table_builder(layout, virtual) for name, (layout, virtual) in _TABLE_LAYOUTS.items()
+        }
         # Preprocess flight records for quick filtering
         self.flight_records_all = []  # All flights regardless of timeframe
         self.preprocess_flights()
@@ -730,45 +1552,57 @@ class StatsWindow(tk.Toplevel):
     def preprocess_flights(self) -> None:
         """Convert raw ops_data into a list of per‑flight dictionaries with all necessary fields."""
         records = []
+        def minutes_between(start: Optional[datetime], finish: Optional[datetime]) -> Optional[float]:
+            if start is None or finish is None:
+                return None
+            try:
+                return (finish - start).total_seconds() / 60
+            except Exception:
+                return None
+
+        def get_op_duration(operations: dict, key: str):
+            times = operations.get(key) or _EMPTY
+            start_dt, start_str = _parse_timestamp(times.get('startTime') or '')
+            finish_dt, finish_str = _parse_timestamp(times.get('finishTime') or '')
+            return start_str, finish_str, minutes_between(start_dt, finish_dt)
+
+        # Bound once for the per-flight loop
+        get_airline_code = self.get_airline_code
+        airline_name_of = self.airline_name
         for flight_id, ops in self.ops_data.items():
             if not isinstance(ops, dict):
                 continue
+            # Keep only well-formed operation entries so the lookups below
+            # need no per-operation type checks.
+            raw_ops = ops.get('operations') or _EMPTY
+            operations = {key: times for key, times in raw_ops.items() if isinstance(times, dict)}
             # Determine flight number and date from the key (e.g. "TU1234_20240101")
             flight_parts = str(flight_id).split('_')
             flight_number = flight_parts[0] if flight_parts else str(flight_id)
             flight_date = None
             if len(flight_parts) > 1:
-                date_str = flight_parts[1]
-                try:
-                    # Parse flight date from the key.  Always convert to a
-                    # plain date rather than a datetime to allow equality
-                    # comparisons with a date object when filtering by day.
-                    dt_tmp = datetime.strptime(date_str, "%Y%m%d")
-                    flight_date = dt_tmp.date()
-                except Exception:
-                    flight_date = None
+                # Parse flight date from the key.  Always a plain date
+                # rather than a datetime to allow equality comparisons with
+                # a date object when filtering by day.
+                flight_date = _key_date(flight_parts[1])
             # Use checkTimes or operations times as fallback for date
             if flight_date is None:
-                # Try to find a date from operations or checkTimes entries
-                times = []
-                for d in ops.get('operations', {}).values():
-                    if isinstance(d, dict):
-                        if d.get('startTime'):
-                            times.append(d['startTime'])
-                        if d.get('finishTime'):
-                            times.append(d['finishTime'])
-                for d in ops.get('checkTimes', {}).values():
-                    times.append(d)
-                if times:
+                # Use the first operation time, else the first checkTimes entry
+                first_time = None
+                for d in operations.values():
+                    first_time = d.get('startTime') or d.get('finishTime')
+                    if first_time:
+                        break
+                if not first_time:
+                    first_time = next(iter((ops.get('checkTimes') or {}).values()), None)
+                if first_time is not None:
                     try:
-                        dt0 = pd.to_datetime(times[0])
-                        # Always convert to plain date
-                        flight_date = dt0.date()
+                        flight_date = _timestamp_date(first_time)
                     except Exception:
                         flight_date = None
             # Determine airline code and name
-            airline_code = self.get_airline_code(flight_number)
-            airline_name = self.airline_settings.get(airline_code, {}).get('name', airline_code)
+            airline_code = get_airline_code(flight_number)
+            airline_name = airline_name_of(airline_code)
             # Parse checklists
             checklist = ops.get('checklist', {}) or {}
             chocks = bool(checklist.get('chocks'))
@@ -781,46 +1615,23 @@ class StatsWindow(tk.Toplevel):
             check_times = ops.get('checkTimes', {}) or {}
             door_open_iso = check_times.get('doorsOpen', '') or ''
             door_close_iso = check_times.get('doorsClosed', '') or ''
-            door_open_str = self.format_time(door_open_iso)
-            door_close_str = self.format_time(door_close_iso)
-            turnaround_duration = None
-            if door_open_iso and door_close_iso:
-                try:
-                    t_open = pd.to_datetime(door_open_iso)
-                    t_close = pd.to_datetime(door_close_iso)
-                    turnaround_duration = (t_close - t_open).total_seconds() / 60
-                except Exception:
-                    turnaround_duration = None
+            t_open, door_open_str = _parse_timestamp(door_open_iso)
+            t_close, door_close_str = _parse_timestamp(door_close_iso)
+            turnaround_duration = minutes_between(t_open, t_close)
             # Parse operations durations
-            operations = ops.get('operations', {}) or {}
-            def get_op_duration(key: str):
-                times = operations.get(key, {}) if isinstance(operations.get(key, {}), dict) else {}
-                start_iso = times.get('startTime', '') or ''
-                finish_iso = times.get('finishTime', '') or ''
-                start_str = self.format_time(start_iso)
-                finish_str = self.format_time(finish_iso)
-                dur = None
-                if start_iso and finish_iso:
-                    try:
-                        s_dt = pd.to_datetime(start_iso)
-                        f_dt = pd.to_datetime(finish_iso)
-                        dur = (f_dt - s_dt).total_seconds() / 60
-                    except Exception:
-                        dur = None
-                return start_str, finish_str, dur
             # GPU
-            gpu_start, gpu_finish, gpu_duration = get_op_duration('gpu')
-            # ACU/APU
-            if 'apu' in operations:
-                apu_start, apu_finish, apu_duration = get_op_duration('apu')
+            gpu_start, gpu_finish, gpu_duration = get_op_duration(operations, 'gpu')
+            # ACU/APU; any 'apu' entry, even a malformed one, wins over 'acu'
+            if 'apu' in raw_ops:
+                apu_start, apu_finish, apu_duration = get_op_duration(operations, 'apu')
             else:
-                apu_start, apu_finish, apu_duration = get_op_duration('acu')
+                apu_start, apu_finish, apu_duration = get_op_duration(operations, 'acu')
             # Turnaround sub operations durations
-            unload_dur = get_op_duration('unloading')[2]
-            disembark_dur = get_op_duration('disembarking')[2]
-            clean_dur = get_op_duration('cleaning')[2]
-            load_dur = get_op_duration('loading')[2]
-            board_dur = get_op_duration('boarding')[2]
+            unload_dur = get_op_duration(operations, 'unloading')[2]
+            disembark_dur = get_op_duration(operations, 'disembarking')[2]
+            clean_dur = get_op_duration(operations, 'cleaning')[2]
+            load_dur = get_op_duration(operations, 'loading')[2]
+            board_dur = get_op_duration(operations, 'boarding')[2]
             # Remarks
             remarks = ops.get('remarks', '') or ''
             # Build record
@@ -841,33 +1652,41 @@ class StatsWindow(tk.Toplevel):
             }
             records.append(rec)
         self.flight_records_all = records
+        # New data: the next compute_data call always recomputes.
+        self._computed_period = None
+        self._dirty: Dict[str, bool] = {}
+        # (view, period) -> per-flight table rows; see cached_rows
+        self._row_cache: Dict[tuple, list] = {}
+        # Columnar copy of the same records for the aggregations in
+        # compute_data.
+        self._columns = FlightColumns.from_records(records)
+        # Positions of the flights in each day / ISO week / month / year, so
+        # compute_data looks a period up instead of scanning every flight.
+        self._by_day: Dict[object, List[int]] = defaultdict(list)
+        self._by_week: Dict[tuple, List[int]] = defaultdict(list)
+        self._by_month: Dict[tuple, List[int]] = defaultdict(list)
+        self._by_year: Dict[int, List[int]] = defaultdict(list)
+        for pos, rec in enumerate(records):
+            d = rec['date']
+            if d is None or pd.isna(d):
+                continue
+            self._by_day[d].append(pos)
+            self._by_week[tuple(d.isocalendar()[:2])].append(pos)
+            self._by_month[(d.year, d.month)].append(pos)
+            self._by_year[d.year].append(pos)
 
     # Utility functions used in preprocessing
+    def airline_name(self, code: str) -> str:
+        """Configured name for an airline code (the code itself if unset)."""
+        return self._airline_name.get(code, code)
+
     @staticmethod
     def get_airline_code(flight_number: str) -> str:
-        if not flight_number:
-            return ''
-        prefix = ''
-        for ch in flight_number:
-            if ch.isalpha():
-                prefix += ch
-            else:
-                break
-        if len(prefix) >= 3:
-            return prefix[:3].upper()
-        elif len(prefix) >= 2:
-            return prefix[:2].upper()
-        return prefix.upper()
+        return _airline_code(flight_number) if flight_number else ''
 
     @staticmethod
     def format_time(iso_string: str) -> str:
-        if not iso_string:
-            return ''
-        try:
-            dt = pd.to_datetime(iso_string)
-            return dt.strftime("%Y-%m-%d %H:%M")
-        except Exception:
-            return iso_string
+        return _parse_timestamp(iso_string)[1]
 
     # ---------------------------------------------------------------------
     # UI creation
@@ -955,7 +1774,7 @@ class StatsWindow(tk.Toplevel):
     # ---------------------------------------------------------------------
     # Data computation
     # ---------------------------------------------------------------------
-    def compute_data(self) -> None:
+    def compute_data(self) -> bool:
         """
         Compute aggregated metrics according to the selected period and
         reference date.  The period type may be Day, Week, Month, Year or
@@ -964,6 +1783,10 @@ class StatsWindow(tk.Toplevel):
         same year and month; for Year, flights in the same calendar
         year.  If period type is All or the date cannot be parsed,
         include all flights.
+
+        Returns False without recomputing anything when the resolved period
+        is the one already computed; otherwise every section is rebuilt and
+        marked dirty for its view.
         """
         # Determine the period type and reference date
         period_type = self.period_type_var.get() if hasattr(self, 'period_type_var') else 'All'
@@ -974,189 +1797,123 @@ class StatsWindow(tk.Toplevel):
                 ref_date = datetime.strptime(date_str, "%Y-%m-%d").date()
             except Exception:
                 ref_date = None
-        # Filter flights accordingly
+        period = (period_type, ref_date) if ref_date is not None else ('All', None)
+        if period == self._computed_period:
+            return False
+        self._computed_period = period
+        # Filter flights accordingly (positions into flight_records_all)
         if period_type == 'All' or ref_date is None:
-            flights = self.flight_records_all[:]
+            positions = list(range(len(self.flight_records_all)))
+        elif period_type == 'Day':
+            positions = self._by_day.get(ref_date, [])
+        elif period_type == 'Week':
+            positions = self._by_week.get(tuple(ref_date.isocalendar()[:2]), [])
+        elif period_type == 'Month':
+            positions = self._by_month.get((ref_date.year, ref_date.month), [])
+        elif period_type == 'Year':
+            positions = self._by_year.get(ref_date.year, [])
         else:
-            flights = []
-            for rec in self.flight_records_all:
-                d = rec.get('date')
-                if d is None:
-                    continue
-                if period_type == 'Day':
-                    if d == ref_date:
-                        flights.append(rec)
-                elif period_type == 'Week':
-                    if d.isocalendar()[:2] == ref_date.isocalendar()[:2]:
-                        flights.append(rec)
-                elif period_type == 'Month':
-                    if d.year == ref_date.year and d.month == ref_date.month:
-                        flights.append(rec)
-                elif period_type == 'Year':
-                    if d.year == ref_date.year:
-                        flights.append(rec)
+            positions = []
         # Store filtered flights for use in UI updates
-        self.filtered_records = flights
-        # Initialise aggregates
-        self.services_totals = {
-            'GPU': {'count': 0, 'time': 0.0, 'min': float('inf'), 'max': 0.0, 'airline_counts': {}, 'airline_times': {}},
-            'ACU': {'count': 0, 'time': 0.0, 'min': float('inf'), 'max': 0.0, 'airline_counts': {}, 'airline_times': {}},
-            'Toilet': {'count': 0, 'airline_counts': {}},
-            'Water': {'count': 0, 'airline_counts': {}},
+        self.filtered_records = [self.flight_records_all[pos] for pos in positions]
+        cols = self.filtered_columns = self._columns.take(positions)
+        self._compute_services(cols)
+        self._compute_checklists(cols)
+        self._compute_turnaround(cols)
+        self._compute_airlines(cols)
+        self._dirty = dict.fromkeys(('services', 'checklists', 'turnaround', 'airlines', 'reports'), True)
+        return True
+
+    # Aggregation helpers.  Per-airline sums are scatter-added by airline id
+    # with np.bincount; the resulting dicts list airlines in first-seen
+    # order, as the views expect.
+    @staticmethod
+    def first_seen(ids: np.ndarray) -> np.ndarray:
+        uniq, first = np.unique(ids, return_index=True)
+        return uniq[np.argsort(first)]
+
+    @staticmethod
+    def duration_stats(values: np.ndarray) -> dict:
+        # count/time/min/max over the known durations; min stays inf and
+        # max 0.0 when there are none (max never drops below 0.0).
+        count = int(np.count_nonzero(~np.isnan(values)))
+        if not count:
+            return {'count': 0, 'time': 0.0, 'min': float('inf'), 'max': 0.0}
+        return {
+            'count': count,
+            'time': float(np.nansum(values)),
+            'min': float(np.nanmin(values)),
+            'max': max(0.0, float(np.nanmax(values))),
         }
-        self.services_flight_rows = {'GPU': [], 'ACU': [], 'Toilet': [], 'Water': []}
-        # Checklist totals
-        chk_counts = {'chocks': 0, 'cones': 0, 'fod': 0, 'security': 0, 'toilet': 0, 'water': 0}
-        chk_total = 0
-        # Checklist counts per airline.  Each entry tracks how many flights
-        # and how many completions per item for that airline.
-        # Example structure: { 'TU': { 'flights': 3, 'chocks': 3, 'cones': 2, ... } }
-        airline_checklists = {}
-        # Turnaround totals
-        tr = {
-            'count': 0,
-            'time': 0.0,
-            'min': float('inf'),
-            'max': 0.0,
-            'exceed45': 0,
-            'op_times': {
-                'unloading': {'time': 0.0, 'count': 0},
-                'disembarking': {'time': 0.0, 'count': 0},
-                'cleaning': {'time': 0.0, 'count': 0},
-                'loading': {'time': 0.0, 'count': 0},
-                'boarding': {'time': 0.0, 'count': 0},
+
+    @staticmethod
+    def format_minutes(values: np.ndarray) -> list:
+        # One decimal place for each duration; blank where it is unknown
+        return np.where(np.isnan(values), '', np.char.mod('%.1f', values)).tolist()
+
+    def _compute_services(self, cols: FlightColumns) -> None:
+        ids = cols.airline_id
+        airline_codes = cols.airline_codes
+
+        def top_and_least(counts: np.ndarray, order: np.ndarray) -> dict:
+            # Most/least used airline codes; ties go to the first-seen one.
+            if not order.size:
+                return {'top_code': '-', 'least_code': '-'}
+            used = counts[order]
+            return {
+                'top_code': airline_codes[order[np.argmax(used)]],
+                'least_code': airline_codes[order[np.argmin(used)]],
             }
+
+        def duration_totals(values: np.ndarray) -> dict:
+            counts, times = _airline_duration_sums(ids, values, airline_codes.size)
+            order = self.first_seen(ids[~np.isnan(values)])
+            return {
+                **self.duration_stats(values),
+                'airline_counts': {airline_codes[k]: int(counts[k]) for k in order},
+                'airline_times': {airline_codes[k]: float(times[k]) for k in order},
+                **top_and_least(counts, order),
+            }
+
+        def request_totals(done: np.ndarray) -> dict:
+            counts = cols.per_airline(done)
+            order = self.first_seen(ids[done])
+            return {
+                'count': int(done.sum()),
+                'airline_counts': {airline_codes[k]: int(counts[k]) for k in order},
+                **top_and_least(counts, order),
+            }
+
+        self.services_totals = {
+            'GPU': duration_totals(cols.gpu_duration),
+            'ACU': duration_totals(cols.apu_duration),
+            'Toilet': request_totals(cols.done('toilet')),
+            'Water': request_totals(cols.done('water')),
         }
-        # Airline metrics
-        airline_metrics = {}
-        for rec in flights:
-            code = rec['airline_code'] or 'N/A'
-            name = rec['airline_name']
-            # GPU
-            if rec['gpuDuration'] is not None:
-                dur = rec['gpuDuration']
-                self.services_totals['GPU']['count'] += 1
-                self.services_totals['GPU']['time'] += dur
-                self.services_totals['GPU']['min'] = min(self.services_totals['GPU']['min'], dur)
-                self.services_totals['GPU']['max'] = max(self.services_totals['GPU']['max'], dur)
-                # per airline
-                self.services_totals['GPU']['airline_counts'][code] = self.services_totals['GPU']['airline_counts'].get(code, 0) + 1
-                self.services_totals['GPU']['airline_times'][code] = self.services_totals['GPU']['airline_times'].get(code, 0.0) + dur
-                # record row
-                self.services_flight_rows['GPU'].append([
-                    rec['flight'], name, rec['gpuStart'], rec['gpuFinish'], f"{dur:.1f}"
-                ])
-            # ACU/APU
-            if rec['apuDuration'] is not None:
-                dur = rec['apuDuration']
-                self.services_totals['ACU']['count'] += 1
-                self.services_totals['ACU']['time'] += dur
-                self.services_totals['ACU']['min'] = min(self.services_totals['ACU']['min'], dur)
-                self.services_totals['ACU']['max'] = max(self.services_totals['ACU']['max'], dur)
-                self.services_totals['ACU']['airline_counts'][code] = self.services_totals['ACU']['airline_counts'].get(code, 0) + 1
-                self.services_totals['ACU']['airline_times'][code] = self.services_totals['ACU']['airline_times'].get(code, 0.0) + dur
-                self.services_flight_rows['ACU'].append([
-                    rec['flight'], name, rec['apuStart'], rec['apuFinish'], f"{dur:.1f}"
-                ])
-            # Toilet
-            if rec['toilet']:
-                self.services_totals['Toilet']['count'] += 1
-                self.services_totals['Toilet']['airline_counts'][code] = self.services_totals['Toilet']['airline_counts'].get(code, 0) + 1
-                self.services_flight_rows['Toilet'].append([
-                    rec['flight'], name, 'Yes'
-                ])
-            # Water
-            if rec['water']:
-                self.services_totals['Water']['count'] += 1
-                self.services_totals['Water']['airline_counts'][code] = self.services_totals['Water']['airline_counts'].get(code, 0) + 1
-                self.services_flight_rows['Water'].append([
-                    rec['flight'], name, 'Yes'
-                ])
-            # Checklist
-            chk_total += 1
-            chk_counts['chocks'] += int(rec['chocks'])
-            chk_counts['cones'] += int(rec['cones'])
-            chk_counts['fod'] += int(rec['fod'])
-            chk_counts['security'] += int(rec['security'])
-            chk_counts['toilet'] += int(rec['toilet'])
-            chk_counts['water'] += int(rec['water'])
-            # Per airline checklist counts
-            if code not in airline_checklists:
-                airline_checklists[code] = {
-                    'flights': 0,
-                    'chocks': 0,
-                    'cones': 0,
-                    'fod': 0,
-                    'security': 0,
-                    'toilet': 0,
-                    'water': 0,
-                }
-            a_chk = airline_checklists[code]
-            a_chk['flights'] += 1
-            a_chk['chocks'] += int(rec['chocks'])
-            a_chk['cones'] += int(rec['cones'])
-            a_chk['fod'] += int(rec['fod'])
-            a_chk['security'] += int(rec['security'])
-            a_chk['toilet'] += int(rec['toilet'])
-            a_chk['water'] += int(rec['water'])
-            # Turnaround
-            if rec['turnaroundDuration'] is not None:
-                dur = rec['turnaroundDuration']
-                tr['count'] += 1
-                tr['time'] += dur
-                tr['min'] = min(tr['min'], dur)
-                tr['max'] = max(tr['max'], dur)
-                if dur > 45:
-                    tr['exceed45'] += 1
-            # Ops durations
-            for op in ['unloading', 'disembarking', 'cleaning', 'loading', 'boarding']:
-                d = rec[f'{op}Duration']
-                if d is not None:
-                    tr['op_times'][op]['time'] += d
-                    tr['op_times'][op]['count'] += 1
-            # Airline metrics accumulate
-            if code not in airline_metrics:
-                airline_metrics[code] = {
-                    'name': name,
-                    'flights': 0,
-                    'turnaround_time': 0.0,
-                    'turnaround_count': 0,
-                    'gpu_time': 0.0,
-                    'gpu_count': 0,
-                    'acu_time': 0.0,
-                    'acu_count': 0,
-                    'cleaning_time': 0.0,
-                    'cleaning_count': 0,
-                    'disembarking_time': 0.0,
-                    'disembarking_count': 0,
-                    'unloading_time': 0.0,
-                    'unloading_count': 0,
-                    'loading_time': 0.0,
-                    'loading_count': 0,
-                    'boarding_time': 0.0,
-                    'boarding_count': 0,
-                    'safety_done': 0,
-                    'safety_total': 0,
-                }
-            m = airline_metrics[code]
-            m['flights'] += 1
-            if rec['turnaroundDuration'] is not None:
-                m['turnaround_time'] += rec['turnaroundDuration']
-                m['turnaround_count'] += 1
-            if rec['gpuDuration'] is not None:
-                m['gpu_time'] += rec['gpuDuration']
-                m['gpu_count'] += 1
-            if rec['apuDuration'] is not None:
-                m['acu_time'] += rec['apuDuration']
-                m['acu_count'] += 1
-            for op in ['cleaning', 'disembarking', 'unloading', 'loading', 'boarding']:
-                d = rec[f'{op}Duration']
-                if d is not None:
-                    m[f'{op}_time'] += d
-                    m[f'{op}_count'] += 1
-            safety_done = int(rec['chocks']) + int(rec['cones']) + int(rec['fod']) + int(rec['security'])
-            m['safety_done'] += safety_done
-            m['safety_total'] += 4
+
+        # Per-flight service table columns, sliced from the filtered arrays.
+        # Rows are only assembled (and durations formatted) when a
+        # service's table is shown.
+        def duration_columns(start: np.ndarray, finish: np.ndarray, values: np.ndarray) -> tuple:
+            has = ~np.isnan(values)
+            return cols.flight[has], cols.airline_name[has], start[has], finish[has], values[has]
+
+        def request_columns(done: np.ndarray) -> tuple:
+            return cols.flight[done], cols.airline_name[done]
+
+        self.services_flight_columns = {
+            'GPU': duration_columns(cols.gpu_start, cols.gpu_finish, cols.gpu_duration),
+            'ACU': duration_columns(cols.apu_start, cols.apu_finish, cols.apu_duration),
+            'Toilet': request_columns(cols.done('toilet')),
+            'Water': request_columns(cols.done('water')),
+        }
+
+    def _compute_checklists(self, cols: FlightColumns) -> None:
+        # Checklist totals
+        checklist_items = list(CHECKLIST_BITS)
+        item_done = {key: cols.done(key) for key in checklist_items}
+        chk_counts = {key: int(done.sum()) for key, done in item_done.items()}
+        chk_total = int(cols.flight.size)
         # Compute checklist summary percentages
         self.checklist_summary = {}
         if chk_total > 0:
@@ -1166,94 +1923,115 @@ class StatsWindow(tk.Toplevel):
             for key in chk_counts:
                 self.checklist_summary[key] = 0.0
 
-        # Compute checklist summary by airline: convert counts to percentages
-        # Each entry will store flights count and completion percentages per item
+        # Checklist summary by airline: flights count and completion
+        # percentage per item, one array entry per airline (first-seen order)
+        order = self.first_seen(cols.airline_id)
+        flights = np.bincount(cols.airline_id, minlength=cols.airline_codes.size)[order]
+        pct = {
+            key: (np.divide(cols.per_airline(done)[order], flights, out=np.zeros(order.size),
+                            where=flights > 0) * 100.0).tolist()
+            for key, done in item_done.items()
+        }
         self.checklist_by_airline = {}
-        for code, counts in airline_checklists.items():
-            flt = counts['flights'] if counts['flights'] else 0
-            if flt == 0:
-                # Avoid division by zero; still record empty row
-                self.checklist_by_airline[code] = {
-                    'code': code,
-                    'name': self.airline_settings.get(code, {}).get('name', code),
-                    'flights': 0,
-                    'chocks': 0.0,
-                    'cones': 0.0,
-                    'fod': 0.0,
-                    'security': 0.0,
-                    'toilet': 0.0,
-                    'water': 0.0,
-                }
-                continue
+        for i, (code, flt) in enumerate(zip(cols.airline_codes[order], flights.tolist())):
             self.checklist_by_airline[code] = {
                 'code': code,
-                'name': self.airline_settings.get(code, {}).get('name', code),
+                'name': self.airline_name(code),
                 'flights': flt,
-                'chocks': (counts['chocks'] / flt) * 100.0,
-                'cones': (counts['cones'] / flt) * 100.0,
-                'fod': (counts['fod'] / flt) * 100.0,
-                'security': (counts['security'] / flt) * 100.0,
-                'toilet': (counts['toilet'] / flt) * 100.0,
-                'water': (counts['water'] / flt) * 100.0,
+                **{key: pct[key][i] for key in checklist_items},
             }
-        # Compute turnaround summary
+
+    def _compute_turnaround(self, cols: FlightColumns) -> None:
+        # Turnaround summary, reduced straight from the duration arrays;
+        # every figure is 0.0 when no duration is known.
+        def average(values: np.ndarray) -> float:
+            return float(np.nanmean(values)) if np.count_nonzero(~np.isnan(values)) else 0.0
+
+        turnaround = cols.turnaround_duration
+        count = int(np.count_nonzero(~np.isnan(turnaround)))
         self.turnaround_summary = {
-            'avg': (tr['time'] / tr['count']) if tr['count'] else 0.0,
-            'min': (tr['min'] if tr['min'] != float('inf') else 0.0),
-            'max': tr['max'],
-            'pct_exceed': (tr['exceed45'] / tr['count']) * 100.0 if tr['count'] else 0.0,
-            'ops_avg': {}
+            'avg': average(turnaround),
+            'min': float(np.nanmin(turnaround)) if count else 0.0,
+            'max': max(0.0, float(np.nanmax(turnaround))) if count else 0.0,
+            'pct_exceed': (int((turnaround > 45).sum()) / count) * 100.0 if count else 0.0,
+            'ops_avg': {op: average(getattr(cols, f'{op}_duration')) for op in _TURN_OPS},
         }
-        for op, vals in tr['op_times'].items():
-            self.turnaround_summary['ops_avg'][op] = (vals['time'] / vals['count']) if vals['count'] else 0.0
+
+    def _compute_airlines(self, cols: FlightColumns) -> None:
+        # Airline metrics, one array entry per airline in first-seen order
+        ids = cols.airline_id
+        n_airlines = cols.airline_codes.size
+        duration_cols = {
+            'turnaround': cols.turnaround_duration, 'gpu': cols.gpu_duration, 'acu': cols.apu_duration,
+            'cleaning': cols.cleaning_duration, 'disembarking': cols.disembarking_duration,
+            'unloading': cols.unloading_duration, 'loading': cols.loading_duration, 'boarding': cols.boarding_duration,
+        }
+        # Each airline is labelled with the name on its first flight.
+        first = np.unique(ids, return_index=True)[1]
+        first.sort()
+        order = ids[first]
+        names = cols.airline_name[first]
+        flights = np.bincount(ids, minlength=n_airlines)[order]
+        safety_done = np.bincount(ids, weights=_POPCOUNT[cols.checklist & SAFETY_MASK], minlength=n_airlines)[order]
+
+        def ratio(num: np.ndarray, den: np.ndarray) -> np.ndarray:
+            return np.divide(num, den, out=np.zeros(order.size), where=den > 0)
+
+        duration_counts = {}
+        averages = {}
+        for key, values in duration_cols.items():
+            counts, sums = _airline_duration_sums(ids, values, n_airlines)
+            duration_counts[key] = counts[order]
+            averages[key] = ratio(sums[order], duration_counts[key])
+        safety_pct = ratio(safety_done, 4 * flights) * 100.0
         # Compute airline summary
-        self.airline_summary = {}
-        # Highlights placeholders
-        best = None; worst = None; longest_gpu = None; fastest_boarding = None
-        for code, m in airline_metrics.items():
-            avg_turnaround = (m['turnaround_time'] / m['turnaround_count']) if m['turnaround_count'] else 0.0
-            avg_gpu = (m['gpu_time'] / m['gpu_count']) if m['gpu_count'] else 0.0
-            avg_acu = (m['acu_time'] / m['acu_count']) if m['acu_count'] else 0.0
-            avg_cleaning = (m['cleaning_time'] / m['cleaning_count']) if m['cleaning_count'] else 0.0
-            avg_boarding = (m['boarding_time'] / m['boarding_count']) if m['boarding_count'] else 0.0
-            avg_unloading = (m['unloading_time'] / m['unloading_count']) if m['unloading_count'] else 0.0
-            avg_disembark = (m['disembarking_time'] / m['disembarking_count']) if m['disembarking_count'] else 0.0
-            avg_loading = (m['loading_time'] / m['loading_count']) if m['loading_count'] else 0.0
-            safety_pct = (m['safety_done'] / m['safety_total']) * 100.0 if m['safety_total'] else 0.0
-            self.airline_summary[code] = {
+        self.airline_summary = {
+            code: {
                 'code': code,
-                'name': m['name'],
-                'flights': m['flights'],
-                'avgTurnaround': avg_turnaround,
-                'avgGPU': avg_gpu,
-                'avgACU': avg_acu,
-                'safetyPct': safety_pct,
-                'avgCleaning': avg_cleaning,
-                'avgBoarding': avg_boarding,
-                'avgUnloading': avg_unloading,
-                'avgDisembark': avg_disembark,
-                'avgLoading': avg_loading,
+                'name': name,
+                'flights': n,
+                'avgTurnaround': turnaround,
+                'avgGPU': gpu,
+                'avgACU': acu,
+                'safetyPct': safety,
+                'avgCleaning': cleaning,
+                'avgBoarding': boarding,
+                'avgUnloading': unloading,
+                'avgDisembark': disembark,
+                'avgLoading': loading,
             }
-            # Determine highlights
-            # Best performer: lowest avg turnaround among airlines with at least one flight
-            if m['flights'] > 0:
-                if best is None or avg_turnaround < best['value']:
-                    best = {'airline': m['name'], 'value': avg_turnaround}
-                if worst is None or avg_turnaround > worst['value']:
-                    worst = {'airline': m['name'], 'value': avg_turnaround}
-            # Longest GPU usage
-            if m['gpu_count'] > 0:
-                if longest_gpu is None or avg_gpu > longest_gpu['value']:
-                    longest_gpu = {'airline': m['name'], 'value': avg_gpu}
-            # Fastest boarding
-            if m['boarding_count'] > 0:
-                if fastest_boarding is None or avg_boarding < fastest_boarding['value']:
-                    fastest_boarding = {'airline': m['name'], 'value': avg_boarding}
+            for code, name, n, turnaround, gpu, acu, safety, cleaning, boarding, unloading, disembark, loading in zip(
+                cols.airline_codes[order], names, flights.tolist(),
+                averages['turnaround'].tolist(), averages['gpu'].tolist(), averages['acu'].tolist(),
+                safety_pct.tolist(), averages['cleaning'].tolist(), averages['boarding'].tolist(),
+                averages['unloading'].tolist(), averages['disembarking'].tolist(), averages['loading'].tolist(),
+            )
+        }
+        # Airlines tab rows, ordered by code and formatted a column at a time
+        codes = cols.airline_codes[order]
+        by_code = np.argsort(codes, kind='stable')
+        fmt = self.format_minutes
+        self.airline_rows = list(zip(
+            codes[by_code].tolist(), names[by_code].tolist(), flights[by_code].tolist(),
+            fmt(averages['turnaround'][by_code]), fmt(averages['gpu'][by_code]), fmt(averages['acu'][by_code]),
+            [f'{pct}%' for pct in fmt(safety_pct[by_code])],
+            fmt(averages['cleaning'][by_code]), fmt(averages['boarding'][by_code]),
+            fmt(averages['unloading'][by_code]), fmt(averages['disembarking'][by_code]), fmt(averages['loading'][by_code]),
+        ))
+
+        # Highlights; ties go to the first-seen airline
+        def highlight(values: np.ndarray, eligible: np.ndarray, pick) -> dict:
+            if not eligible.any():
+                return {'airline': '-', 'value': 0.0}
+            k = np.flatnonzero(eligible)[pick(values[eligible])]
+            return {'airline': names[k], 'value': float(values[k])}
+
         self.airline_highlights = {
-            'best': best or {'airline': '-', 'value': 0.0},
-            'worst': worst or {'airline': '-', 'value': 0.0},
-            'longest_gpu': longest_gpu or {'airline': '-', 'value': 0.0},
-            'fastest_boarding': fastest_boarding or {'airline': '-', 'value': 0.0},
+            # Best/worst performer: lowest/highest avg turnaround among airlines with flights
+            'best': highlight(averages['turnaround'], flights > 0, np.argmin),
+            'worst': highlight(averages['turnaround'], flights > 0, np.argmax),
+            'longest_gpu': highlight(averages['gpu'], duration_counts['gpu'] > 0, np.argmax),
+            'fastest_boarding': highlight(averages['boarding'], duration_counts['boarding'] > 0, np.argmin),
         }
 
     # ---------------------------------------------------------------------
@@ -1268,11 +2046,37 @@ class StatsWindow(tk.Toplevel):
         selected.
         """
         self.compute_data()
-        self.update_service_view()
-        self.update_checklist_view()
-        self.update_turnaround_view()
-        self.update_airlines_view()
-        self.update_reports_view()
+        # Only sections recomputed since their last refresh are rebuilt.
+        views = (
+            ('services', self.update_service_view),
+            ('checklists', self.update_checklist_view),
+            ('turnaround', self.update_turnaround_view),
+            ('airlines', self.update_airlines_view),
+            ('reports', self.update_reports_view),
+        )
+        for section, refresh in views:
+            if self._dirty.get(section):
+                refresh()
+                self._dirty[section] = False
+
+    def cached_rows(self, view: str, build) -> list:
+        """
+        Per-flight table rows for a view in the current period.  Rows are
+        built once per period and kept for the most recently shown ones;
+        callers get a copy they are free to sort.
+        """
+        key = (view, self._computed_period)
+        cache = self._row_cache
+        rows = cache.pop(key, None)
+        if rows is None:
+            # Dicts keep insertion order, so the first key is the least
+            # recently used one.
+            if len(cache) >= VIEW_ROW_CACHE_SIZE:
+                cache.pop(next(iter(cache)))
+            rows = build()
+        # (Re-)inserting marks the entry as most recently used
+        cache[key] = rows
+        return list(rows)
 
     def update_service_view(self) -> None:
         """Refresh the Services tab to reflect the selected service and timeframe."""
@@ -1284,12 +2088,9 @@ class StatsWindow(tk.Toplevel):
             else:
                 btn.configure(bg="#007bff")
         # Clear frames
-        for child in self.services_kpi_frame.winfo_children():
-            child.destroy()
-        for child in self.services_table_container.winfo_children():
-            child.destroy()
-        for child in self.services_summary_container.winfo_children():
-            child.destroy()
+        _clear(self.services_kpi_frame)
+        _clear(self.services_table_container)
+        _clear(self.services_summary_container)
         service = self.selected_service.get()
         # Build KPI cards for the selected service
         cards = []
@@ -1300,17 +2101,16 @@ class StatsWindow(tk.Toplevel):
             avg_time = (total_time / count) if count else 0.0
             min_time = totals['min'] if totals['min'] != float('inf') else 0.0
             max_time = totals['max']
-            # Determine top and least airlines by usage
-            airline_counts = totals['airline_counts']
-            top_airline = '-' if not airline_counts else max(airline_counts.items(), key=lambda x: x[1])[0]
-            least_airline = '-' if not airline_counts else min(airline_counts.items(), key=lambda x: x[1])[0]
+            # Top and least airlines by usage
+            top_airline = totals['top_code']
+            least_airline = totals['least_code']
             # Convert codes to names if available
             if top_airline != '-':
-                top_airline_name = self.airline_settings.get(top_airline, {}).get('name', top_airline)
+                top_airline_name = self.airline_name(top_airline)
             else:
                 top_airline_name = '-'
             if least_airline != '-':
-                least_airline_name = self.airline_settings.get(least_airline, {}).get('name', least_airline)
+                least_airline_name = self.airline_name(least_airline)
             else:
                 least_airline_name = '-'
             cards = [
@@ -1325,11 +2125,10 @@ class StatsWindow(tk.Toplevel):
         else:  # Toilet or Water
             totals = self.services_totals[service]
             count = totals['count']
-            airline_counts = totals['airline_counts']
-            top_airline = '-' if not airline_counts else max(airline_counts.items(), key=lambda x: x[1])[0]
-            least_airline = '-' if not airline_counts else min(airline_counts.items(), key=lambda x: x[1])[0]
-            top_name = self.airline_settings.get(top_airline, {}).get('name', top_airline) if top_airline != '-' else '-'
-            least_name = self.airline_settings.get(least_airline, {}).get('name', least_airline) if least_airline != '-' else '-'
+            top_airline = totals['top_code']
+            least_airline = totals['least_code']
+            top_name = self.airline_name(top_airline) if top_airline != '-' else '-'
+            least_name = self.airline_name(least_airline) if least_airline != '-' else '-'
             cards = [
                 ("Total requests", f"{count}", "#007bff" if service == 'Toilet' else "#17a2b8"),
                 ("Top airline", top_name, "#28a745"),
@@ -1337,77 +2136,62 @@ class StatsWindow(tk.Toplevel):
             ]
         self.create_kpi_cards(self.services_kpi_frame, cards)
         # Table columns and rows
+        flight_columns = self.services_flight_columns[service]
         if service in ('GPU', 'ACU'):
-            columns = ['Flight', 'Airline', 'Start', 'Finish', 'Duration']
-            rows = self.services_flight_rows[service][:]
-            col_widths = {
-                'Flight': 140, 'Airline': 120, 'Start': 140, 'Finish': 140, 'Duration': 90
-            }
+            layout = 'services_duration'
+            def build_rows():
+                *text_columns, durations = flight_columns
+                return list(zip(*(col.tolist() for col in text_columns), self.format_minutes(durations)))
         else:
-            columns = ['Flight', 'Airline', 'Requested']
-            rows = self.services_flight_rows[service][:]
-            col_widths = {'Flight': 140, 'Airline': 120, 'Requested': 80}
+            layout = 'services_request'
+            def build_rows():
+                return [[flight, name, 'Yes'] for flight, name in zip(*(col.tolist() for col in flight_columns))]
+        rows = self.cached_rows(f'services:{service}', build_rows)
         # Build table
         table_frame = tk.Frame(self.services_table_container, bg="#eef5ff")
         table_frame.pack(fill=tk.BOTH, expand=True)
-        self.build_table(table_frame, columns, rows, col_widths)
+        self._builders[layout](table_frame, rows)
         # Summary by airline table
         summary_rows = []
+        airline_name_of = self.airline_name
         if service in ('GPU', 'ACU'):
             totals = self.services_totals[service]
             for code, cnt in sorted(totals['airline_counts'].items()):
-                name = self.airline_settings.get(code, {}).get('name', code)
+                name = airline_name_of(code)
                 avg_time = (totals['airline_times'][code] / cnt) if cnt else 0.0
                 summary_rows.append([code, name, cnt, f"{avg_time:.1f}"])
-            summary_columns = ['Code', 'Airline', 'Flights', 'Avg Time']
-            col_widths2 = {'Code': 80, 'Airline': 120, 'Flights': 80, 'Avg Time': 90}
+            summary_layout = 'services_duration_summary'
         else:
             totals = self.services_totals[service]
             for code, cnt in sorted(totals['airline_counts'].items()):
-                name = self.airline_settings.get(code, {}).get('name', code)
+                name = airline_name_of(code)
                 summary_rows.append([code, name, cnt])
-            summary_columns = ['Code', 'Airline', 'Requests']
-            col_widths2 = {'Code': 80, 'Airline': 120, 'Requests': 80}
+            summary_layout = 'services_request_summary'
         summary_frame = tk.Frame(self.services_summary_container, bg="#eef5ff")
         summary_frame.pack(fill=tk.BOTH, expand=True)
-        self.build_table(summary_frame, summary_columns, summary_rows, col_widths2)
+        self._builders[summary_layout](summary_frame, summary_rows)
 
     def update_checklist_view(self) -> None:
         """Refresh the Checklists tab."""
         # Clear existing widgets in the checklist tab
-        for child in self.checklist_content.winfo_children():
-            child.destroy()
+        _clear(self.checklist_content)
         # Build KPI cards for overall checklist completion percentages
-        cards = [
-            ("Chocks", f"{self.checklist_summary.get('chocks', 0.0):.1f}%", "#007bff"),
-            ("Cones", f"{self.checklist_summary.get('cones', 0.0):.1f}%", "#17a2b8"),
-            ("FOD", f"{self.checklist_summary.get('fod', 0.0):.1f}%", "#28a745"),
-            ("Security", f"{self.checklist_summary.get('security', 0.0):.1f}%", "#20c997"),
-            ("Toilet", f"{self.checklist_summary.get('toilet', 0.0):.1f}%", "#ffc107"),
-            ("Water", f"{self.checklist_summary.get('water', 0.0):.1f}%", "#dc3545"),
-        ]
+        summary = self.checklist_summary
+        cards = [(title, f"{summary.get(key, 0.0):.1f}%", colour) for title, key, colour in _CHECKLIST_CARD_SPEC]
         self.create_kpi_cards(self.checklist_content, cards)
         # Build table of per‑flight checklist statuses
-        columns = ['Flight', 'Airline', 'Chocks', 'Cones', 'FOD', 'Security', 'Toilet', 'Water', 'Door Open', 'Door Close']
-        rows = []
-        for rec in getattr(self, 'filtered_records', self.flight_records_all):
-            rows.append([
-                rec['flight'], rec['airline_name'],
-                'Yes' if rec['chocks'] else 'No',
-                'Yes' if rec['cones'] else 'No',
-                'Yes' if rec['fod'] else 'No',
-                'Yes' if rec['security'] else 'No',
-                'Yes' if rec['toilet'] else 'No',
-                'Yes' if rec['water'] else 'No',
-                rec['doorOpen'], rec['doorClose'],
-            ])
-        col_widths = {
-            'Flight': 140, 'Airline': 120, 'Chocks': 70, 'Cones': 70, 'FOD': 70, 'Security': 80,
-            'Toilet': 70, 'Water': 70, 'Door Open': 140, 'Door Close': 140
-        }
+        def build_rows():
+            # Yes/No text for all six items via one lookup into _YN, one
+            # row per checklist item
+            cols = self.filtered_columns
+            flags = (cols.checklist & _CHECKLIST_BIT_VALUES[:, None]) != 0
+            done = _YN[flags.view(np.uint8)].tolist()
+            return list(zip(cols.flight.tolist(), cols.airline_name.tolist(), *done,
+                            cols.door_open.tolist(), cols.door_close.tolist()))
+        rows = self.cached_rows('checklists', build_rows)
         table_frame = tk.Frame(self.checklist_content, bg="#eef5ff")
         table_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=(5, 5))
-        self.build_table(table_frame, columns, rows, col_widths)
+        self._builders['checklist'](table_frame, rows)
         # Build summary by airline table
         summary_rows = []
         for code, data in sorted(getattr(self, 'checklist_by_airline', {}).items(), key=lambda x: x[0]):
@@ -1422,20 +2206,14 @@ class StatsWindow(tk.Toplevel):
                 f"{data['toilet']:.1f}%",
                 f"{data['water']:.1f}%",
             ])
-        summary_columns = ['Code', 'Airline', 'Flights', 'Chocks %', 'Cones %', 'FOD %', 'Security %', 'Toilet %', 'Water %']
-        col_widths_sum = {
-            'Code': 80, 'Airline': 120, 'Flights': 60, 'Chocks %': 80, 'Cones %': 80,
-            'FOD %': 80, 'Security %': 90, 'Toilet %': 80, 'Water %': 80
-        }
         summary_frame = tk.Frame(self.checklist_content, bg="#eef5ff")
         summary_frame.pack(fill=tk.BOTH, expand=False, padx=5, pady=(0, 10))
-        self.build_table(summary_frame, summary_columns, summary_rows, col_widths_sum)
+        self._builders['checklist_summary'](summary_frame, summary_rows)
 
     def update_turnaround_view(self) -> None:
         """Refresh the Turnaround tab."""
         # Clear existing widgets
-        for child in self.turnaround_content.winfo_children():
-            child.destroy()
+        _clear(self.turnaround_content)
         # KPI cards for turnaround performance
         avg_turn = self.turnaround_summary['avg']
         fastest = self.turnaround_summary['min']
@@ -1448,31 +2226,19 @@ class StatsWindow(tk.Toplevel):
             (">45 min", f"{pct_exceed:.1f}%", "#17a2b8"),
         ]
         # Include averages for individual operations
-        for op in ['unloading', 'disembarking', 'cleaning', 'loading', 'boarding']:
-            avg_op = self.turnaround_summary['ops_avg'][op]
-            label = f"Avg {op.capitalize()}"
-            cards.append((label, f"{avg_op:.1f} min", "#6f42c1"))
+        ops_avg = self.turnaround_summary['ops_avg']
+        cards.extend((title, f"{ops_avg[op]:.1f} min", colour) for title, op, colour in _TURN_OP_CARD_SPEC)
         self.create_kpi_cards(self.turnaround_content, cards)
         # Per‑flight table
-        columns = ['Flight', 'Airline', 'Door Open', 'Door Close', 'Turnaround', 'Unload', 'Disembark', 'Clean', 'Load', 'Board']
-        rows = []
-        for rec in getattr(self, 'filtered_records', self.flight_records_all):
-            rows.append([
-                rec['flight'], rec['airline_name'], rec['doorOpen'], rec['doorClose'],
-                f"{rec['turnaroundDuration']:.1f}" if rec['turnaroundDuration'] is not None else '',
-                f"{rec['unloadingDuration']:.1f}" if rec['unloadingDuration'] is not None else '',
-                f"{rec['disembarkingDuration']:.1f}" if rec['disembarkingDuration'] is not None else '',
-                f"{rec['cleaningDuration']:.1f}" if rec['cleaningDuration'] is not None else '',
-                f"{rec['loadingDuration']:.1f}" if rec['loadingDuration'] is not None else '',
-                f"{rec['boardingDuration']:.1f}" if rec['boardingDuration'] is not None else '',
-            ])
-        col_widths = {
-            'Flight': 140, 'Airline': 120, 'Door Open': 140, 'Door Close': 140, 'Turnaround': 110,
-            'Unload': 90, 'Disembark': 110, 'Clean': 90, 'Load': 90, 'Board': 90
-        }
+        def build_rows():
+            cols = self.filtered_columns
+            durations = [self.format_minutes(getattr(cols, f'{op}_duration')) for op in ('turnaround', *_TURN_OPS)]
+            return list(zip(cols.flight.tolist(), cols.airline_name.tolist(),
+                            cols.door_open.tolist(), cols.door_close.tolist(), *durations))
+        rows = self.cached_rows('turnaround', build_rows)
         table_frame = tk.Frame(self.turnaround_content, bg="#eef5ff")
         table_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=(5, 5))
-        self.build_table(table_frame, columns, rows, col_widths)
+        self._builders['turnaround'](table_frame, rows)
         # Summary by airline table: show flights and averages for turnaround and sub operations
         summary_rows = []
         for code, data in sorted(getattr(self, 'airline_summary', {}).items(), key=lambda x: x[0]):
@@ -1487,19 +2253,13 @@ class StatsWindow(tk.Toplevel):
                 f"{data['avgLoading']:.1f}",
                 f"{data['avgBoarding']:.1f}",
             ])
-        summary_columns = ['Code', 'Airline', 'Flights', 'Avg Turn', 'Avg Unload', 'Avg Disembark', 'Avg Clean', 'Avg Load', 'Avg Board']
-        col_widths_sum = {
-            'Code': 80, 'Airline': 120, 'Flights': 60, 'Avg Turn': 100, 'Avg Unload': 90,
-            'Avg Disembark': 110, 'Avg Clean': 90, 'Avg Load': 90, 'Avg Board': 90
-        }
         summary_frame = tk.Frame(self.turnaround_content, bg="#eef5ff")
         summary_frame.pack(fill=tk.BOTH, expand=False, padx=5, pady=(0, 10))
-        self.build_table(summary_frame, summary_columns, summary_rows, col_widths_sum)
+        self._builders['turnaround_summary'](summary_frame, summary_rows)
 
     def update_airlines_view(self) -> None:
         """Refresh the Airlines tab."""
-        for child in self.airline_content.winfo_children():
-            child.destroy()
+        _clear(self.airline_content)
         # Highlights cards
         best = self.airline_highlights['best']
         worst = self.airline_highlights['worst']
@@ -1512,21 +2272,12 @@ class StatsWindow(tk.Toplevel):
             ("Fastest boarding", f"{fastest_board['airline']} ({fastest_board['value']:.1f} min)", "#ffc107"),
         ]
         self.create_kpi_cards(self.airline_content, cards)
-        # Build table of airline metrics
-        columns = ['Code', 'Airline', 'Flights', 'Avg Turnaround', 'Avg GPU', 'Avg ACU', 'Safety %', 'Avg Clean', 'Avg Board', 'Avg Unload', 'Avg Disembark', 'Avg Load']
-        rows = []
-        for code, data in sorted(self.airline_summary.items(), key=lambda x: x[0]):
-            rows.append([
-                code, data['name'], data['flights'], f"{data['avgTurnaround']:.1f}", f"{data['avgGPU']:.1f}", f"{data['avgACU']:.1f}",
-                f"{data['safetyPct']:.1f}%", f"{data['avgCleaning']:.1f}", f"{data['avgBoarding']:.1f}", f"{data['avgUnloading']:.1f}", f"{data['avgDisembark']:.1f}", f"{data['avgLoading']:.1f}"
-            ])
-        col_widths = {
-            'Code': 80, 'Airline': 140, 'Flights': 60, 'Avg Turnaround': 120, 'Avg GPU': 90, 'Avg ACU': 90,
-            'Safety %': 90, 'Avg Clean': 90, 'Avg Board': 90, 'Avg Unload': 90, 'Avg Disembark': 110, 'Avg Load': 90
-        }
+        # Build table of airline metrics, prepared by _compute_airlines;
+        # copied so sorting the table leaves them as built
+        rows = list(self.airline_rows)
         table_frame = tk.Frame(self.airline_content, bg="#eef5ff")
         table_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=(5, 10))
-        self.build_table(table_frame, columns, rows, col_widths)
+        self._builders['airlines'](table_frame, rows)
 
     def update_reports_view(self) -> None:
         """
@@ -1536,18 +2287,25 @@ class StatsWindow(tk.Toplevel):
         a table listing flights with remarks for the current period.
         """
         # Clear existing content
-        for child in self.reports_content.winfo_children():
-            child.destroy()
-        # Gather reports from filtered flights
-        rows = []
-        for rec in getattr(self, 'filtered_records', self.flight_records_all):
-            remarks = rec.get('remarks', '').strip()
-            if remarks:
+        _clear(self.reports_content)
+        # Gather reports from filtered flights, truncating long remarks for
+        # table display in the same pass
+        def build_rows():
+            rows = []
+            for rec in getattr(self, 'filtered_records', self.flight_records_all):
+                remarks = (rec.get('remarks') or '').strip()
+                if not remarks:
+                    continue
+                if len(remarks) > 120:
+                    remarks = remarks[:117] + '...'
+                flight_date = rec.get('date')
                 rows.append([
                     rec['flight'], rec['airline_name'],
-                    rec.get('date').strftime("%Y-%m-%d") if rec.get('date') else '',
+                    flight_date.strftime("%Y-%m-%d") if flight_date else '',
                     remarks
                 ])
+            return rows
+        rows = self.cached_rows('reports', build_rows)
         # KPI cards: total number of reports
         total_reports = len(rows)
         cards = [
@@ -1556,22 +2314,9 @@ class StatsWindow(tk.Toplevel):
         self.create_kpi_cards(self.reports_content, cards)
         # Build table if there are any reports
         if rows:
-            columns = ['Flight', 'Airline', 'Date', 'Remarks']
-            # Limit remarks width in the table by truncating if necessary
-            formatted_rows = []
-            for r in rows:
-                # Optionally truncate long remarks for table display
-                remark = r[3]
-                # Show first 80 chars; full text is available in table cell
-                if len(remark) > 120:
-                    short = remark[:117] + '...'
-                else:
-                    short = remark
-                formatted_rows.append([r[0], r[1], r[2], short])
-            col_widths = {'Flight': 140, 'Airline': 140, 'Date': 100, 'Remarks': 400}
             table_frame = tk.Frame(self.reports_content, bg="#eef5ff")
             table_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=(5, 10))
-            self.build_table(table_frame, columns, formatted_rows, col_widths)
+            self._builders['reports'](table_frame, rows)
 
     # ---------------------------------------------------------------------
     # Shared UI helpers
@@ -1589,60 +2334,205 @@ class StatsWindow(tk.Toplevel):
             tk.Label(cf, text=title, fg="#ffffff", bg=colour, font=("Arial", 9, "bold")).pack(anchor='w')
             tk.Label(cf, text=value, fg="#ffffff", bg=colour, font=("Arial", 14, "bold")).pack(anchor='w')
 
+    @staticmethod
+    def is_numeric_column(col: str) -> bool:
+        # Duration / numeric columns
+        lowered = col.lower()
+        return any(keyword in lowered for keyword in ('duration', 'avg', 'time'))
+
+    @staticmethod
+    def table_sort_key(val, numeric: bool):
+        # Try to parse numeric values
+        try:
+            if val in ('', None):
+                return 0.0
+            return float(val) if numeric else val
+        except Exception:
+            # Dates and times parse
+            try:
+                return pd.to_datetime(val)
+            except Exception:
+                return val
+
+    def row_sorter(self, columns: list, rows: list):
+        """
+        Return a sort(col, reverse) function that reorders rows in place by
+        one column.  Each column's sort keys are extracted once; numeric
+        keys are ordered with a stable np.argsort instead of Python compares.
+        """
+        base = list(rows)
+        perm = np.arange(len(base))
+        keys = {}
+        def sort(col, reverse):
+            nonlocal perm
+            if col not in keys:
+                idx = columns.index(col)
+                if col in _DATE_COLUMNS:
+                    # Parsed in one call, as seconds since the epoch
+                    parsed = pd.to_datetime(pd.Series([r[idx] for r in base], dtype=object),
+                                            errors='coerce', format='mixed', utc=True)
+                    seconds = (parsed - pd.Timestamp(0, tz='UTC')).dt.total_seconds()
+                    keys[col] = seconds.fillna(-np.inf).to_numpy(dtype=np.float64)
+                else:
+                    numeric = self.is_numeric_column(col)
+                    extracted = [self.table_sort_key(r[idx], numeric) for r in base]
+                    arr = np.array(extracted) if extracted else np.empty(0)
+                    keys[col] = arr if arr.dtype.kind in 'if' else extracted
+            col_keys = keys[col]
+            if isinstance(col_keys, np.ndarray):
+                current = col_keys[perm]
+                order = np.argsort(-current if reverse else current, kind='stable')
+            else:
+                order = sorted(range(perm.size), key=lambda i: col_keys[perm[i]], reverse=reverse)
+            perm = perm[order]
+            rows[:] = [base[i] for i in perm]
+        return sort
+
+    def make_table_builder(self, layout: tuple, virtual: bool = False):
+        """
+        Return a build(parent, rows) function for a fixed column layout of
+        (heading, width) pairs.  The column list and widths are prepared
+        once; virtual tables use the canvas table for long row lists.
+        """
+        columns = [heading for heading, _ in layout]
+        col_widths = dict(layout)
+        def build(parent: tk.Frame, rows: list):
+            if virtual and len(rows) > CANVAS_TABLE_MIN_ROWS:
+                return self.build_canvas_table(parent, columns, rows, col_widths)
+            return self.build_table(parent, columns, rows, col_widths)
+        return build
+
+    def build_canvas_table(self, parent: tk.Frame, columns: list, rows: list, col_widths: Dict[str, int]) -> tk.Canvas:
+        """
+        Draw a sortable table on a Canvas, creating text items only for the
+        rows currently in view.  Used instead of build_table for long
+        per-flight tables.  Returns the body Canvas.
+        """
+        row_height = 22
+        font = ("Arial", 9)
+        cell_font = tkfont.Font(root=parent, font=font)
+        xs = []
+        widths = []
+        x = 0
+        for c in columns:
+            xs.append(x)
+            widths.append(col_widths.get(c, 100))
+            x += widths[-1]
+        total_width = x
+        # Cell text cut down to its column width, keyed by (text, width)
+        fitted = {}
+        def fit(text, width):
+            out = fitted.get((text, width))
+            if out is None:
+                out = text
+                if cell_font.measure(text) > width:
+                    # Longest prefix that still fits with the ellipsis
+                    lo, hi = 0, len(text)
+                    while lo < hi:
+                        mid = (lo + hi + 1) // 2
+                        if cell_font.measure(text[:mid] + '\u2026') <= width:
+                            lo = mid
+                        else:
+                            hi = mid - 1
+                    out = text[:lo] + '\u2026'
+                fitted[(text, width)] = out
+            return out
+        header = tk.Canvas(parent, height=row_height, bg="#003366", highlightthickness=0)
+        body = tk.Canvas(parent, bg="#ffffff", highlightthickness=0)
+        header.configure(scrollregion=(0, 0, total_width, row_height))
+        body.configure(scrollregion=(0, 0, total_width, row_height * len(rows)),
+                       yscrollincrement=row_height)
+        # Rows drawn so far, and whether a redraw is already queued
+        view = {'drawn': None, 'pending': False}
+        def redraw():
+            view['pending'] = False
+            top = body.canvasy(0)
+            first = max(0, int(top // row_height))
+            last = min(len(rows), int((top + body.winfo_height()) // row_height) + 1)
+            if view['drawn'] == (first, last):
+                return
+            view['drawn'] = (first, last)
+            body.delete('row')
+            for i in range(first, last):
+                y = i * row_height
+                body.create_line(0, y + row_height - 1, total_width, y + row_height - 1,
+                                 fill="#e6e6e6", tags='row')
+                for x, w, val in zip(xs, widths, rows[i]):
+                    body.create_text(x + 4, y + row_height // 2, text=fit(str(val), w - 8), anchor='w',
+                                     fill="#333333", font=font, tags='row')
+        def schedule_redraw():
+            # A drag or wheel burst fires many scroll callbacks; redraw once
+            # when Tk goes idle.
+            if not view['pending']:
+                view['pending'] = True
+                body.after_idle(redraw)
+        # Sortable headings, as in build_table
+        sort_states = {c: False for c in columns}
+        sort_rows = self.row_sorter(columns, rows)
+        def sort_by(idx):
+            col = columns[idx]
+            reverse = sort_states[col]
+            sort_states[col] = not reverse
+            sort_rows(col, reverse)
+            # Update headings
+            for i, c in enumerate(columns):
+                arrow = ''
+                if i == idx:
+                    arrow = ' \u25BC' if reverse else ' \u25B2'
+                header.itemconfigure(f'heading{i}', text=c + arrow)
+            view['drawn'] = None
+            redraw()
+        for idx, (c, x) in enumerate(zip(columns, xs)):
+            tag = f'heading{idx}'
+            header.create_text(x + 4, row_height // 2, text=c, anchor='w', fill="#ffffff",
+                               font=("Arial", 9, "bold"), tags=tag)
+            header.tag_bind(tag, '<Button-1>', lambda e, idx=idx: sort_by(idx))
+        vsb = ttk.Scrollbar(parent, orient="vertical", command=body.yview)
+        def xview(*args):
+            body.xview(*args)
+            header.xview(*args)
+        hsb = ttk.Scrollbar(parent, orient="horizontal", command=xview)
+        def on_yscroll(first, last):
+            vsb.set(first, last)
+            schedule_redraw()
+        body.configure(yscrollcommand=on_yscroll, xscrollcommand=hsb.set)
+        body.bind('<Configure>', lambda e: schedule_redraw())
+        # Canvas has no default wheel bindings (Treeview does)
+        def on_wheel(event):
+            up = event.num == 4 or (event.num != 5 and event.delta > 0)
+            body.yview_scroll(-3 if up else 3, 'units')
+        for widget in (header, body):
+            widget.bind('<MouseWheel>', on_wheel)
+            widget.bind('<Button-4>', on_wheel)
+            widget.bind('<Button-5>', on_wheel)
+        header.grid(row=0, column=0, sticky='ew')
+        body.grid(row=1, column=0, sticky='nsew')
+        vsb.grid(row=1, column=1, sticky='ns')
+        hsb.grid(row=2, column=0, sticky='ew')
+        parent.grid_rowconfigure(1, weight=1)
+        parent.grid_columnconfigure(0, weight=1)
+        return body
+
     def build_table(self, parent: tk.Frame, columns: list, rows: list, col_widths: Dict[str, int]) -> ttk.Treeview:
         """
         Create a sortable Treeview table with the given columns and populate it
         with the provided rows.  Column widths are defined via the
         col_widths dictionary.  Returns the Treeview instance.
         """
-        style = ttk.Style()
-        try:
-            style.theme_use('clam')
-        except Exception:
-            pass
-        style.configure(
-            "Stats.Treeview",
-            background="#ffffff",
-            foreground="#333333",
-            fieldbackground="#ffffff",
-            rowheight=22,
-            font=("Arial", 9)
-        )
-        style.configure(
-            "Stats.Treeview.Heading",
-            background="#003366",
-            foreground="#ffffff",
-            font=("Arial", 9, "bold")
-        )
-        style.map("Stats.Treeview", background=[('selected', '#b3d7ff')])
         tree = ttk.Treeview(parent, columns=columns, show='headings', style="Stats.Treeview")
-        # Determine index mapping
-        col_index = {c: i for i, c in enumerate(columns)}
         # Setup headings with sortable callback
         sort_states = {c: False for c in columns}
-        def sort_key(col, val):
-            # Try to parse numeric values
-            try:
-                # Duration / numeric columns
-                if val in ('', None):
-                    return 0.0
-                return float(val) if any(keyword in col.lower() for keyword in ['duration', 'avg', 'time']) else val
-            except Exception:
-                # Dates and times parse
-                try:
-                    return pd.to_datetime(val)
-                except Exception:
-                    return val
+        sort_rows = self.row_sorter(columns, rows)
         def sort_by(col):
             reverse = sort_states[col]
             sort_states[col] = not reverse
-            rows.sort(key=lambda r: sort_key(col, r[col_index[col]]), reverse=reverse)
+            sort_rows(col, reverse)
             # Update headings
             for c in columns:
                 arrow = ''
                 if c == col:
                     arrow = ' \u25BC' if reverse else ' \u25B2'
-                tree.heading(c, text=c, command=lambda c=c: sort_by(c))
+                tree.heading(c, text=c + arrow, command=lambda c=c: sort_by(c))
             refresh()
         for c in columns:
             tree.heading(c, text=c, command=lambda c=c: sort_by(c))
@@ -1651,16 +2541,44 @@ class StatsWindow(tk.Toplevel):
         # Scrollbars
         vsb = ttk.Scrollbar(parent, orient="vertical", command=tree.yview)
         hsb = ttk.Scrollbar(parent, orient="horizontal", command=tree.xview)
-        tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        # Rows are inserted a page at a time, like the main flight table:
+        # the next page goes in once the view nears the last inserted row.
+        page = {'shown': 0, 'pending': False}
+        def load_more():
+            page['pending'] = False
+            start = page['shown']
+            end = min(len(rows), start + TREE_PAGE_SIZE)
+            for i in range(start, end):
+                tree.insert('', tk.END, iid=str(i), values=rows[i])
+            page['shown'] = end
+        def on_yscroll(first, last):
+            vsb.set(first, last)
+            if float(last) > 0.9 and not page['pending'] and page['shown'] < len(rows):
+                page['pending'] = True
+                tree.after_idle(load_more)
+        tree.configure(yscrollcommand=on_yscroll, xscrollcommand=hsb.set)
         tree.grid(row=0, column=0, sticky='nsew')
         vsb.grid(row=0, column=1, sticky='ns')
         hsb.grid(row=1, column=0, sticky='ew')
         parent.grid_rowconfigure(0, weight=1)
         parent.grid_columnconfigure(0, weight=1)
         def refresh():
-            tree.delete(*tree.get_children())
-            for r in rows:
-                tree.insert('', tk.END, values=r)
+            # Re-sorting keeps as many rows in place as were already shown:
+            # the items already inserted (iids "0".."n-1") get the new row
+            # values and only the missing ones are inserted.  The tree is
+            # taken out of the grid while it is refilled so Tk lays it out
+            # once rather than after every change.
+            tree.grid_remove()
+            existing = page['shown']
+            shown = min(len(rows), max(existing, TREE_PAGE_SIZE))
+            item = tree.item
+            for i in range(existing):
+                item(str(i), values=rows[i])
+            insert = tree.insert
+            for i in range(existing, shown):
+                insert('', tk.END, iid=str(i), values=rows[i])
+            page['shown'] = shown
+            tree.grid()
         refresh()
         return tree
 
@@ -1685,6 +2603,10 @@ class SettingsWindow(tk.Toplevel):
     airline_settings : dict
         Mutable dictionary of airline settings to edit.
     """
+    # type_list row for the airline's general instructions.  Types are stored
+    # upper-cased, so this cannot clash with one.
+    _GENERAL_TYPE_IID = '#general'
+
     def __init__(self, parent: 'CoordinationApp', airline_settings: Dict[str, Dict[str, str]]) -> None:
         super().__init__(parent.root)
         self.parent = parent
@@ -1702,6 +2624,17 @@ class SettingsWindow(tk.Toplevel):
         self.name_var = tk.StringVar()
         self.type_var = tk.StringVar()
         self.layout_var = tk.StringVar()
+        # (code, name) currently shown for each airline_tree row
+        self._airline_rows: Dict[str, tuple] = {}
+        # Confirmation dialog, built on first use and then reused
+        self._confirm_dialog = None
+        self._confirm_action = None
+        self._confirm_dont_ask = None
+        # Lists ('airlines', 'types') waiting for the queued idle refresh,
+        # and the airline to select once it has run
+        self._refresh_pending = set()
+        self._refresh_job = None
+        self._select_after_refresh = None
         # Build UI
         self.create_widgets()
         # Populate airlines list
@@ -1718,26 +2651,6 @@ class SettingsWindow(tk.Toplevel):
         tk.Label(left_frame, text="Airlines", bg="#eef5ff", fg="#003366", font=("Arial", 10, "bold")).pack(anchor='w')
         # Treeview for airline codes and names
         cols = ('Code', 'Name')
-        style = ttk.Style()
-        try:
-            style.theme_use('clam')
-        except Exception:
-            pass
-        style.configure(
-            "Settings.Treeview",
-            background="#ffffff",
-            foreground="#333333",
-            fieldbackground="#ffffff",
-            rowheight=22,
-            font=("Arial", 9)
-        )
-        style.configure(
-            "Settings.Treeview.Heading",
-            background="#003366",
-            foreground="#ffffff",
-            font=("Arial", 9, "bold")
-        )
-        style.map("Settings.Treeview", background=[('selected', '#b3d7ff')])
         self.airline_tree = ttk.Treeview(left_frame, columns=cols, show='headings', style="Settings.Treeview", selectmode='browse', height=20)
         for c, w in [('Code', 80), ('Name', 140)]:
             self.airline_tree.heading(c, text=c)
@@ -1772,9 +2685,11 @@ class SettingsWindow(tk.Toplevel):
         types_frame.pack(fill=tk.BOTH, expand=True)
         # List of types
         tk.Label(types_frame, text="Types", bg="#eef5ff", fg="#003366").grid(row=0, column=0, sticky='w', padx=5, pady=2)
-        self.type_list = tk.Listbox(types_frame, height=5)
+        # Rows are keyed by type, so one can be removed without a rebuild
+        self.type_list = ttk.Treeview(types_frame, show='tree', style="Settings.Treeview", selectmode='browse', height=5)
+        self.type_list.column('#0', width=140)
         self.type_list.grid(row=1, column=0, sticky='nw', padx=5, pady=2)
-        self.type_list.bind('<<ListboxSelect>>', self.load_selected_type)
+        self.type_list.bind('<<TreeviewSelect>>', self.load_selected_type)
         # Type entry and details
         tk.Label(types_frame, text="Selected Type:", bg="#eef5ff", fg="#003366").grid(row=0, column=1, sticky='e', padx=5, pady=2)
         self.type_entry = tk.Entry(types_frame, textvariable=self.type_var, width=20)
@@ -1796,23 +2711,80 @@ class SettingsWindow(tk.Toplevel):
     # Data loading and refreshing
     # ------------------------------------------------------------------
     def refresh_airline_list(self) -> None:
-        """Populate the airline list from the current airline_settings."""
-        # Clear tree
-        for i in self.airline_tree.get_children():
-            self.airline_tree.delete(i)
-        # Insert entries sorted by code
-        for code in sorted(self.airline_settings.keys()):
-            name = self.airline_settings.get(code, {}).get('name', '')
-            self.airline_tree.insert('', tk.END, iid=code, values=(code, name))
+        """
+        Bring the airline list in line with the current airline_settings.
+        Only rows whose code was removed, added or renamed are touched.
+        """
+        tree = self.airline_tree
+        shown = self._airline_rows
+        airlines = self.parent.airline_list()
+        wanted = {code for code, _ in airlines}
+        stale = [code for code in shown if code not in wanted]
+        if stale:
+            tree.delete(*stale)
+            for code in stale:
+                del shown[code]
+        # Codes are kept sorted, so a new code is inserted at its index
+        for index, values in enumerate(airlines):
+            code = values[0]
+            if code not in shown:
+                tree.insert('', index, iid=code, values=values)
+            elif shown[code] != values:
+                tree.item(code, values=values)
+            shown[code] = values
 
     def refresh_type_list(self, code: str) -> None:
         """Refresh the list of aircraft types for the given airline code."""
-        self.type_list.delete(0, tk.END)
+        self._clear_type_list()
         # Always include blank entry for general instructions
-        self.type_list.insert(tk.END, "")
-        data = self.airline_settings.get(code, {})
-        for t in sorted(data.get('types', {}).keys()):
-            self.type_list.insert(tk.END, t)
+        self.type_list.insert('', tk.END, iid=self._GENERAL_TYPE_IID, text="")
+        types = self.airline_settings.get(code, _EMPTY).get('types', _EMPTY)
+        for t in sorted(types):
+            self.type_list.insert('', tk.END, iid=t, text=t)
+
+    def _schedule_refresh(self, what: str) -> None:
+        """
+        Refresh the 'airlines' or 'types' list once Tk is idle, so several
+        changes in one pass through the event loop redraw the lists once.
+        """
+        self._refresh_pending.add(what)
+        if self._refresh_job is None:
+            self._refresh_job = self.after_idle(self._do_refresh)
+
+    def _do_refresh(self) -> None:
+        self._refresh_job = None
+        if not self.winfo_exists():
+            # The window was closed before Tk got to the refresh
+            return
+        pending, self._refresh_pending = self._refresh_pending, set()
+        if 'airlines' in pending:
+            self.refresh_airline_list()
+            code, self._select_after_refresh = self._select_after_refresh, None
+            if code is not None and code in self._airline_rows:
+                self.airline_tree.selection_set(code)
+        if 'types' in pending:
+            self.refresh_type_list(_norm(self.code_var.get()))
+
+    def _clear_type_list(self) -> None:
+        rows = self.type_list.get_children()
+        if rows:
+            self.type_list.delete(*rows)
+
+    def _clear_type_form(self) -> None:
+        """Empty the aircraft type fields."""
+        # type_entry is bound to type_var, so setting the variable clears it
+        self.type_var.set('')
+        self.type_instr_text.delete('1.0', tk.END)
+        self.type_layout_entry.delete(0, tk.END)
+
+    def _clear_airline_form(self) -> None:
+        """Empty the whole form, including the type list and fields."""
+        self.code_var.set('')
+        self.name_var.set('')
+        self.instr_text.delete('1.0', tk.END)
+        self.layout_var.set('')
+        self._clear_type_list()
+        self._clear_type_form()
 
     # ------------------------------------------------------------------
     # Event handlers
@@ -1825,7 +2797,7 @@ class SettingsWindow(tk.Toplevel):
         code = selected[0]
         # Set code and name
         self.code_var.set(code)
-        data = self.airline_settings.get(code, {})
+        data = self.airline_settings.get(code, _EMPTY)
         self.name_var.set(data.get('name', ''))
         # General instructions and layout
         self.instr_text.delete('1.0', tk.END)
@@ -1833,54 +2805,111 @@ class SettingsWindow(tk.Toplevel):
         self.layout_var.set(data.get('layoutUrl', ''))
         # Refresh type list and reset type fields
         self.refresh_type_list(code)
-        self.type_var.set('')
-        self.type_entry.delete(0, tk.END)
-        self.type_instr_text.delete('1.0', tk.END)
-        self.type_layout_entry.delete(0, tk.END)
+        self._clear_type_form()
 
     def load_selected_type(self, event=None) -> None:
         """Load the selected aircraft type's instructions and layout."""
-        sel = self.type_list.curselection()
+        sel = self.type_list.selection()
         if not sel:
             return
-        idx = sel[0]
-        t = self.type_list.get(idx)
+        t = '' if sel[0] == self._GENERAL_TYPE_IID else sel[0]
+        # type_entry is bound to type_var, so this also fills the entry
         self.type_var.set(t)
-        # Clear entry field and set selected type
-        self.type_entry.delete(0, tk.END)
-        self.type_entry.insert(0, t)
         # Retrieve airline code
-        c = self.code_var.get().strip().upper()
-        data = self.airline_settings.get(c, {})
+        c = _norm(self.code_var.get())
+        data = self.airline_settings.get(c, _EMPTY)
         if t == "":
             # General instructions
             self.type_instr_text.delete('1.0', tk.END)
             self.type_layout_entry.delete(0, tk.END)
         else:
-            type_data = data.get('types', {}).get(t, {})
+            type_data = data.get('types', _EMPTY).get(t, _EMPTY)
             self.type_instr_text.delete('1.0', tk.END)
             self.type_instr_text.insert(tk.END, type_data.get('instructions', ''))
             self.type_layout_entry.delete(0, tk.END)
             self.type_layout_entry.insert(0, type_data.get('layoutUrl', ''))
 
+    def confirm(self, title: str, message: str, on_yes, on_dont_ask=None) -> None:
+        """
+        Ask a yes/no question and call on_yes() if the user agrees.  Unlike
+        messagebox.askyesno this returns straight away: the answer is picked
+        up by a trace on the dialog's variable, so the main loop keeps
+        running while the dialog is open.  With on_dont_ask, a "don't ask
+        again" box is shown and on_dont_ask() is called if it was ticked
+        when the user agreed.
+        """
+        if self._confirm_dialog is None:
+            dialog = tk.Toplevel(self)
+            dialog.withdraw()
+            dialog.transient(self)
+            dialog.resizable(False, False)
+            dialog.configure(bg="#eef5ff")
+            self._confirm_label = tk.Label(dialog, bg="#eef5ff", fg="#003366", wraplength=320, justify='left')
+            self._confirm_label.pack(padx=15, pady=(15, 10))
+            self._dont_ask_var = tk.BooleanVar(dialog)
+            self._dont_ask_check = tk.Checkbutton(
+                dialog, text="Don't ask again this session", variable=self._dont_ask_var,
+                bg="#eef5ff", fg="#003366", activebackground="#eef5ff"
+            )
+            self._confirm_var = tk.BooleanVar(dialog)
+            self._confirm_var.trace_add('write', self._on_confirm_answer)
+            btn_frame = tk.Frame(dialog, bg="#eef5ff")
+            btn_frame.pack(pady=(0, 10))
+            self._confirm_buttons = btn_frame
+            yes_btn = tk.Button(btn_frame, text="Yes", width=8, bg="#dc3545", fg="#ffffff",
+                                command=lambda: self._confirm_var.set(True))
+            yes_btn.pack(side=tk.LEFT, padx=5)
+            tk.Button(btn_frame, text="No", width=8, bg="#6c757d", fg="#ffffff",
+                      command=lambda: self._confirm_var.set(False)).pack(side=tk.LEFT, padx=5)
+            dialog.protocol("WM_DELETE_WINDOW", lambda: self._confirm_var.set(False))
+            dialog.bind('<Escape>', lambda e: self._confirm_var.set(False))
+            self._confirm_yes_btn = yes_btn
+            self._confirm_dialog = dialog
+        dialog = self._confirm_dialog
+        self._confirm_action = on_yes
+        self._confirm_dont_ask = on_dont_ask
+        dialog.title(title)
+        self._confirm_label.configure(text=message)
+        self._dont_ask_var.set(False)
+        if on_dont_ask is not None:
+            self._dont_ask_check.pack(padx=15, anchor='w', before=self._confirm_buttons)
+        else:
+            self._dont_ask_check.pack_forget()
+        dialog.deiconify()
+        dialog.lift()
+        dialog.grab_set()
+        self._confirm_yes_btn.focus_set()
+
+    def _on_confirm_answer(self, *args) -> None:
+        dialog = self._confirm_dialog
+        dialog.grab_release()
+        dialog.withdraw()
+        action, self._confirm_action = self._confirm_action, None
+        dont_ask, self._confirm_dont_ask = self._confirm_dont_ask, None
+        if action is not None and self._confirm_var.get():
+            if dont_ask is not None and self._dont_ask_var.get():
+                dont_ask()
+            action()
+
     # ------------------------------------------------------------------
     # Actions
     # ------------------------------------------------------------------
     def save_mapping(self) -> None:
         """Persist current entries to airline_settings and update views."""
-        c = self.code_var.get().strip().upper()
+        c = _norm(self.code_var.get())
         if not c:
             messagebox.showwarning("Validation", "Code cannot be empty.")
             return
         if c not in self.airline_settings:
             self.airline_settings[c] = {'name': '', 'instructions': '', 'layoutUrl': '', 'types': {}}
+            self.parent.add_airline_code(c)
         # Update name
         self.airline_settings[c]['name'] = self.name_var.get().strip()
         # General instructions and layout
         self.airline_settings[c]['instructions'] = self.instr_text.get('1.0', tk.END).strip()
         self.airline_settings[c]['layoutUrl'] = self.layout_var.get().strip()
         # Determine selected type and update accordingly
-        t = self.type_entry.get().strip().upper()
+        t = _norm(self.type_entry.get())
         # Normalize numeric types (remove trailing .0)
         try:
             if t and any(ch.isdigit() for ch in t) and '.' in t:
@@ -1892,52 +2921,67 @@ class SettingsWindow(tk.Toplevel):
         if t:
             instr = self.type_instr_text.get('1.0', tk.END).strip()
             layout = self.type_layout_entry.get().strip()
-            if 'types' not in self.airline_settings[c]:
-                self.airline_settings[c]['types'] = {}
             self.airline_settings[c]['types'][t] = {'instructions': instr, 'layoutUrl': layout}
-        # Refresh lists
-        self.refresh_airline_list()
-        self.airline_tree.selection_set(c)
-        self.refresh_type_list(c)
-        # Persist settings to disk and upload to Firebase via parent's save method
+        # Persist settings to disk and upload to Firebase via parent's save
+        # method; this also rebuilds the name map the airline list reads.
+        self.parent.mark_airline_settings_dirty(c)
         self.parent.save_airline_settings()
+        # Refresh lists
+        self._select_after_refresh = c
+        self._schedule_refresh('airlines')
+        self._schedule_refresh('types')
         messagebox.showinfo("Saved", f"Settings for {c} saved.")
 
     def delete_mapping(self) -> None:
         """Delete the selected airline or aircraft type from settings."""
-        c = self.code_var.get().strip().upper()
+        c = _norm(self.code_var.get())
         if not c or c not in self.airline_settings:
             return
-        t = self.type_entry.get().strip().upper()
+        t = _norm(self.type_entry.get())
         if not t:
             # Delete entire airline mapping
-            if messagebox.askyesno("Delete", f"Delete all settings for {c}?"):
-                del self.airline_settings[c]
-                self.refresh_airline_list()
-                # Clear forms
-                self.code_var.set('')
-                self.name_var.set('')
-                self.instr_text.delete('1.0', tk.END)
-                self.layout_var.set('')
-                self.type_list.delete(0, tk.END)
-                self.type_entry.delete(0, tk.END)
-                self.type_instr_text.delete('1.0', tk.END)
-                self.type_layout_entry.delete(0, tk.END)
-                # Persist changes to file and upload to Firebase
-                self.parent.save_airline_settings()
+            self._confirm_delete(f"Delete all settings for {c}?", lambda: self._delete_airline(c))
         else:
             # Delete selected type
-            if messagebox.askyesno("Delete", f"Delete type {t} for {c}?"):
-                self.airline_settings[c].get('types', {}).pop(t, None)
-                self.refresh_type_list(c)
-                # Clear type fields
-                self.type_var.set('')
-                self.type_entry.delete(0, tk.END)
-                self.type_instr_text.delete('1.0', tk.END)
-                self.type_layout_entry.delete(0, tk.END)
-                # Persist changes to file and upload to Firebase
-                self.parent.save_airline_settings()
+            self._confirm_delete(f"Delete type {t} for {c}?", lambda: self._delete_type(c, t))
 
+    def _confirm_delete(self, message: str, action) -> None:
+        if self.parent.skip_delete_confirm:
+            action()
+        else:
+            self.confirm("Delete", message, action, on_dont_ask=self._stop_confirming_deletes)
+
+    def _stop_confirming_deletes(self) -> None:
+        self.parent.skip_delete_confirm = True
+
+    def _delete_airline(self, c: str) -> None:
+        # The airline may have gone while the dialog was open
+        if self.airline_settings.pop(c, None) is None:
+            return
+        self.parent.remove_airline_code(c)
+        self.parent.mark_airline_settings_dirty(c)
+        # Rows are keyed by airline code, so drop just that row
+        if self._airline_rows.pop(c, None) is not None:
+            self.airline_tree.delete(c)
+        self._clear_airline_form()
+        # Persist changes to file and upload to Firebase; queued so
+        # consecutive deletions are saved together
+        self.parent.schedule_save_airline_settings()
+
+    def _delete_type(self, c: str, t: str) -> None:
+        airline = self.airline_settings.get(c)
+        if airline is None:
+            return
+        # Every airline entry is created with a 'types' dict
+        airline['types'].pop(t, None)
+        self.parent.mark_airline_settings_dirty(c, t)
+        # Remove just that entry rather than rebuilding the list
+        if self.type_list.exists(t):
+            self.type_list.delete(t)
+        self._clear_type_form()
+        # Persist changes to file and upload to Firebase; queued so
+        # consecutive deletions are saved together
+        self.parent.schedule_save_airline_settings()
 
 if __name__ == "__main__":
     root = tk.Tk()